@@ -0,0 +1,80 @@
+"""
+Batched commands benchmark: per device wall time of the netmiko engine with commands sent one by one and with
+``batch_commands`` enabled, one device at a time against a simulated Cisco IOS switch. Fails if any device falls back
+from batched mode to sending commands one by one, as a fallback costs a round trip instead of saving one.
+
+Usage: ``python benchmarks/bench_batch_commands.py --devices 50``
+"""
+import sys
+import logging
+import argparse
+import ipaddress
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+from simulated_switch import start_switch
+
+
+class FallbackCounter(logging.Handler):
+    """
+    Log handler counting devices which could not obtain batched commands output.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.fallbacks = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "cannot obtain batched commands output" in record.getMessage():
+            self.fallbacks += 1
+
+
+def measure(log: logging.Logger, _config: dict, devices: int, port: int) -> list[float]:
+    """
+    Collect details of simulated devices one at a time, with requests built from a provided configuration.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param int devices: number of devices
+    :param int port: simulated switch TCP port
+    :return: processing time of each device with details obtained, in seconds
+    :rtype: list[float]
+    """
+    first = ipaddress.ip_address('127.0.0.1')
+    requests = [{**main.build_request('cisco_ios', str(first + index), _config), 'port': port}
+                for index in range(devices)]
+    elapsed = []
+    main.collect_devices(log, requests, 1, observer=lambda _json, seconds, failure: failure or elapsed.append(seconds))
+    return elapsed
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="batched commands benchmark")
+    arguments.add_argument('--devices', type=int, default=50, help="number of simulated devices (default: 50)")
+    arguments.add_argument('--port', type=int, default=8022, help="simulated switch TCP port (default: 8022)")
+    arguments.add_argument('--delay', type=float, default=0.05, help="device command delay in seconds"
+                                                                     " (default: 0.05)")
+    options = arguments.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    log = logging.getLogger('bench')
+    # fallback warnings reach a counter and are printed along with errors
+    log.setLevel(logging.WARNING)
+    counter = FallbackCounter()
+    log.addHandler(counter)
+    switch = start_switch(options.port, delay=options.delay)
+    try:
+        print(f"{options.devices} device(s), one at a time, {options.delay:.2f}s per command")
+        for name, batch_commands in (('one by one', False), ('batched', True)):
+            _config = {'username': 'bench', 'password': 'bench', 'batch_commands': batch_commands}
+            elapsed = measure(log, _config, options.devices, options.port)
+            print(f"{name:<10} {len(elapsed)}/{options.devices} obtained, per device: mean"
+                  f" {statistics.mean(elapsed):.3f}s, median {statistics.median(elapsed):.3f}s,"
+                  f" max {max(elapsed):.3f}s")
+    finally:
+        switch.terminate()
+    if counter.fallbacks:
+        sys.exit(f"batched mode fell back to separate commands on {counter.fallbacks} device(s)")
@@ -0,0 +1,72 @@
+"""
+Collection engines benchmark: obtain details of simulated switches with the netmiko engine (one thread per parallel
+connection) and the asyncssh engine (single event loop), comparing wall time and throughput.
+Each loopback address stands for a separate device, all served by a single simulated switch process.
+
+Usage: ``python benchmarks/bench_engines.py --devices 200 --workers 50``
+"""
+import sys
+import time
+import logging
+import argparse
+import ipaddress
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+from simulated_switch import start_switch
+
+
+def build_requests(devices: int, port: int) -> list[dict]:
+    """
+    Create request details dicts of simulated devices, one loopback address per device.
+
+    :param int devices: number of devices
+    :param int port: simulated switch TCP port
+    :return: request details dicts
+    :rtype: list[dict]
+    """
+    first = ipaddress.ip_address('127.0.0.1')
+    return [{'device_type': 'cisco_ios', 'host': str(first + index), 'port': port, 'username': 'bench',
+             'password': 'bench'} for index in range(devices)]
+
+
+def measure(log: logging.Logger, engine: str, devices: int, workers: int, port: int) -> tuple[int, float]:
+    """
+    Collect details of all simulated devices with a provided engine.
+
+    :param log: log object
+    :param str engine: collection engine name: netmiko or asyncssh
+    :param int devices: number of devices
+    :param int workers: number of devices in flight
+    :param int port: simulated switch TCP port
+    :return: number of devices with details obtained and wall time, in seconds
+    :rtype: tuple[int, float]
+    """
+    requests = build_requests(devices, port)
+    started = time.perf_counter()
+    results = main.collect_devices(log, requests, workers, engine)
+    return sum(1 for details in results if details), time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="netmiko and asyncssh engines benchmark")
+    arguments.add_argument('--devices', type=int, default=200, help="number of simulated devices (default: 200)")
+    arguments.add_argument('--workers', type=int, default=50, help="devices in flight (default: 50)")
+    arguments.add_argument('--port', type=int, default=8022, help="simulated switch TCP port (default: 8022)")
+    arguments.add_argument('--delay', type=float, default=0.05, help="device command delay in seconds"
+                                                                     " (default: 0.05)")
+    options = arguments.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    log = logging.getLogger('bench')
+    switch = start_switch(options.port, delay=options.delay)
+    try:
+        print(f"{options.devices} device(s), {options.workers} in flight, {options.delay:.2f}s per command")
+        for engine in ('netmiko', 'asyncssh'):
+            obtained, elapsed = measure(log, engine, options.devices, options.workers, options.port)
+            print(f"{engine:<9} {obtained}/{options.devices} obtained in {elapsed:.2f}s"
+                  f" ({options.devices / elapsed:.1f} device(s)/s)")
+    finally:
+        switch.terminate()
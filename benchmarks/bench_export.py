@@ -0,0 +1,94 @@
+"""
+Report export benchmark: write a report of N devices with 48 ports each as CSV (plain, gzip, zstd) and Parquet
+(snappy, gzip, zstd) files, comparing write time, file size and time to load a file back into an Arrow table.
+Requires ``pip install pyarrow`` (and ``zstandard`` for zstd compressed CSV files).
+
+Usage: ``python benchmarks/bench_export.py --devices 10000 --ports 48``
+"""
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+import pyarrow.csv
+import pyarrow.parquet
+
+# report format and compression of each variant
+VARIANTS = (('csv', ''), ('csv', 'gzip'), ('csv', 'zstd'), ('parquet', ''), ('parquet', 'gzip'), ('parquet', 'zstd'))
+STATUSES = ('connected', 'notconnect', 'disabled')
+
+
+def write_report(log: logging.Logger, directory: Path, export_format: str, compression: str, devices: int,
+                 ports: int) -> tuple[Path, float]:
+    """
+    Write a report of simulated devices with a report writer of a provided format.
+
+    :param log: log object
+    :param directory: exports directory
+    :param str export_format: report format: csv or parquet
+    :param str compression: report compression, empty for a format default
+    :param int devices: number of devices
+    :param int ports: number of ports per device
+    :type log: logging.Logger
+    :type directory: Path
+    :return: saved report file path and write time, in seconds
+    :rtype: tuple[Path, float]
+    """
+    writer_class = main.ParquetReportWriter if export_format == 'parquet' else main.ReportWriter
+    writer = writer_class(log, directory, compression)
+    names = [f"Gi1/0/{index}" for index in range(1, ports + 1)]
+    # port statuses are drawn with a fixed seed, so each variant writes the same report
+    statuses = random.Random(0)
+    started = time.perf_counter()
+    for index in range(devices):
+        host = f"10.{index // 65536}.{index // 256 % 256}.{index % 256}"
+        details = main.DeviceDetails(host, f"FOC{index:08d}", "WS-C2960X-48FPD-L", names,
+                                     [statuses.choice(STATUSES) for _ in range(ports)])
+        writer.record({'device_type': 'cisco_ios', 'host': host}, details)
+    path = Path(writer.close()[0])
+    return path, time.perf_counter() - started
+
+
+def load_report(path: Path) -> tuple[int, float]:
+    """
+    Load a report file into an Arrow table.
+
+    :param path: report file path
+    :type path: Path
+    :return: number of rows loaded and load time, in seconds
+    :rtype: tuple[int, float]
+    """
+    started = time.perf_counter()
+    if path.suffix == '.parquet':
+        table = pyarrow.parquet.read_table(path)
+    else:
+        table = pyarrow.csv.read_csv(path)
+    return table.num_rows, time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="report export formats benchmark")
+    arguments.add_argument('--devices', type=int, default=10000, help="number of devices (default: 10000)")
+    arguments.add_argument('--ports', type=int, default=48, help="number of ports per device (default: 48)")
+    options = arguments.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    log = logging.getLogger('bench')
+    print(f"{options.devices} device(s) x {options.ports} port(s)")
+    for export_format, compression in VARIANTS:
+        if compression == 'zstd' and export_format == 'csv' and main.zstandard is None:
+            print(f"{export_format:<7} {compression:<6} skipped, zstandard is not installed")
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            path, written = write_report(log, Path(directory), export_format, compression, options.devices,
+                                         options.ports)
+            rows, loaded = load_report(path)
+            codec = compression or ('snappy' if export_format == 'parquet' else 'none')
+            print(f"{export_format:<7} {codec:<7} {path.stat().st_size / 2 ** 20:8.2f} MiB,"
+                  f" written in {written:6.2f}s, {rows} row(s) loaded in {loaded:6.3f}s")
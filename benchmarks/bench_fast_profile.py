@@ -0,0 +1,59 @@
+"""
+Fast netmiko profile benchmark: per device wall time of the netmiko engine with default netmiko settings and with
+a ``fast_profile`` applied, one device at a time against a simulated Cisco IOS switch.
+
+Usage: ``python benchmarks/bench_fast_profile.py --devices 50``
+"""
+import sys
+import logging
+import argparse
+import ipaddress
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+from simulated_switch import start_switch
+
+
+def measure(log: logging.Logger, _config: dict, devices: int, port: int) -> list[float]:
+    """
+    Collect details of simulated devices one at a time, with requests built from a provided configuration.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param int devices: number of devices
+    :param int port: simulated switch TCP port
+    :return: processing time of each device with details obtained, in seconds
+    :rtype: list[float]
+    """
+    first = ipaddress.ip_address('127.0.0.1')
+    requests = [{**main.build_request('cisco_ios', str(first + index), _config), 'port': port}
+                for index in range(devices)]
+    elapsed = []
+    main.collect_devices(log, requests, 1, observer=lambda _json, seconds, failure: failure or elapsed.append(seconds))
+    return elapsed
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="fast netmiko profile benchmark")
+    arguments.add_argument('--devices', type=int, default=50, help="number of simulated devices (default: 50)")
+    arguments.add_argument('--port', type=int, default=8022, help="simulated switch TCP port (default: 8022)")
+    arguments.add_argument('--delay', type=float, default=0.05, help="device command delay in seconds"
+                                                                     " (default: 0.05)")
+    options = arguments.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    log = logging.getLogger('bench')
+    switch = start_switch(options.port, delay=options.delay)
+    try:
+        print(f"{options.devices} device(s), one at a time, {options.delay:.2f}s per command")
+        for name, fast_profile in (('default', {}), ('fast_profile', {'cisco_ios': {}})):
+            _config = {'username': 'bench', 'password': 'bench', 'fast_profile': fast_profile}
+            elapsed = measure(log, _config, options.devices, options.port)
+            print(f"{name:<12} {len(elapsed)}/{options.devices} obtained, per device: mean"
+                  f" {statistics.mean(elapsed):.3f}s, median {statistics.median(elapsed):.3f}s,"
+                  f" max {max(elapsed):.3f}s")
+    finally:
+        switch.terminate()
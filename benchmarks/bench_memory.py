@@ -0,0 +1,94 @@
+"""
+Device details memory benchmark: memory held by collected details of N devices with 48 ports each, kept
+in the former list of rows layout (one ``[IP, SN, Model, Port, PortStatus]`` list per port) and in ``DeviceDetails``,
+as measured by ``tracemalloc``.
+
+Usage: ``python benchmarks/bench_memory.py --devices 10000 --ports 48``
+"""
+import sys
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+STATUSES = ('connected', 'notconnect', 'disabled', 'err-disabled')
+
+
+def parsed_interfaces(ports: int) -> list[dict[str, str]]:
+    """
+    Create interfaces of a single device, as returned by TextFSM parsing: each device gets its own string objects.
+
+    :param int ports: number of ports
+    :return: parsed interfaces output
+    :rtype: list[dict[str, str]]
+    """
+    return [{'port': f"Gi1/0/{index}", 'status': "".join(STATUSES[index % 3])} for index in range(1, ports + 1)]
+
+
+def list_rows(host: str, serial_number: str, model: str, interfaces: list[dict[str, str]]) -> list[list[Any]]:
+    """
+    Former device details layout: a report row list per port.
+
+    :param str host: device IP address
+    :param str serial_number: device serial number
+    :param str model: device model
+    :param interfaces: parsed interfaces output
+    :type interfaces: list[dict[str, str]]
+    :return: report rows
+    :rtype: list[list[Any]]
+    """
+    return [[host, serial_number, model, interface['port'], interface['status']] for interface in interfaces]
+
+
+def compact_details(host: str, serial_number: str, model: str,
+                    interfaces: list[dict[str, str]]) -> main.DeviceDetails:
+    """
+    Current device details layout.
+
+    :param str host: device IP address
+    :param str serial_number: device serial number
+    :param str model: device model
+    :param interfaces: parsed interfaces output
+    :type interfaces: list[dict[str, str]]
+    :return: device details
+    :rtype: DeviceDetails
+    """
+    return main.DeviceDetails(host, serial_number, model, [interface['port'] for interface in interfaces],
+                              [interface['status'] for interface in interfaces])
+
+
+def measure(layout: Callable[..., Any], devices: int, ports: int) -> tuple[int, int]:
+    """
+    Collect details of all devices in a provided layout, keeping them all in memory as a run without a sink would.
+
+    :param layout: function building details of a single device
+    :param int devices: number of devices
+    :param int ports: number of ports per device
+    :return: memory held once all devices are collected and peak memory, in bytes
+    :rtype: tuple[int, int]
+    """
+    tracemalloc.start()
+    # like parsed strings, model of each device is a separate string object
+    results = [layout(f"10.{index // 65536}.{index // 256 % 256}.{index % 256}", f"FOC{index:08d}",
+                      "".join("WS-C2960X-48FPD-L"), parsed_interfaces(ports)) for index in range(devices)]
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return held, peak
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="device details memory benchmark")
+    arguments.add_argument('--devices', type=int, default=10000, help="number of devices (default: 10000)")
+    arguments.add_argument('--ports', type=int, default=48, help="number of ports per device (default: 48)")
+    options = arguments.parse_args()
+
+    print(f"{options.devices} device(s) x {options.ports} port(s)")
+    for name, layout in (('list rows', list_rows), ('DeviceDetails', compact_details)):
+        held, peak = measure(layout, options.devices, options.ports)
+        print(f"{name:<13} held {held / 2 ** 20:8.1f} MiB ({held / options.devices:8.0f} B/device),"
+              f" peak {peak / 2 ** 20:8.1f} MiB")
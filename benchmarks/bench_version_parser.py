@@ -0,0 +1,131 @@
+"""
+Show version parser micro-benchmark: parse a large ``show version`` output of a switch stack with the former parser,
+which scanned the output once per detail (serial number, then model) and lowered each line up to twice per scan,
+and with the current parser finding both details in a single pass, lowering each line once.
+
+Usage: ``python benchmarks/bench_version_parser.py --members 9 --iterations 2000``
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+HEADER = """Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT9K_IOSXE), Version 16.9.4, RELEASE SOFTWARE (fc2)
+Technical Support: http://www.cisco.com/techsupport
+Copyright (c) 1986-2019 by Cisco Systems, Inc.
+Compiled Thu 22-Aug-19 18:09 by mcpre
+
+ROM: IOS-XE ROMMON
+BOOTLDR: System Bootstrap, Version 16.10.1r[FC2], RELEASE SOFTWARE (P)
+
+sw-core uptime is 1 year, 12 weeks, 3 days, 7 hours, 41 minutes
+Uptime for this control processor is 1 year, 12 weeks, 3 days, 7 hours, 44 minutes
+System returned to ROM by Power Failure or Unknown at 21:36:53 UTC Tue Mar 5 2019
+System image file is "flash:packages.conf"
+Last reload reason: Power Failure or Unknown
+
+Technology Package License Information:
+
+------------------------------------------------------------------------------
+Technology-package                                     Technology-package
+Current                        Type                       Next reboot
+------------------------------------------------------------------------------
+network-advantage       Smart License                 network-advantage
+dna-advantage           Subscription Smart License    dna-advantage
+
+cisco C9300-48P (X86) processor with 1392780K/6147K bytes of memory.
+Processor board ID FCW2233L0AB
+{members} Virtual Ethernet interfaces
+{ports} Gigabit Ethernet interfaces
+2048K bytes of non-volatile configuration memory.
+8388608K bytes of physical memory.
+
+Switch Ports Model              SW Version        SW Image              Mode
+------ ----- -----              ----------        ----------            ----
+"""
+# details of a stack member, printed for an active member right below a summary table
+DETAILS = """
+Base Ethernet MAC Address          : 70:b3:17:2a:{number:02x}:00
+Motherboard Assembly Number        : 73-18271-03
+Motherboard Serial Number          : FOC2232{number:04d}
+Model Revision Number              : A0
+Motherboard Revision Number        : A0
+Model Number                       : C9300-48P
+System Serial Number               : FCW2233L{number:03d}
+"""
+# details section of each other stack member
+MEMBER = """
+Switch {number:02d}
+---------
+Switch uptime                      : 1 year, 12 weeks, 3 days, 7 hours, 48 minutes""" + DETAILS
+
+
+def build_output(members: int) -> str:
+    """
+    Build ``show version`` output of a switch stack, with a summary row and a details section per stack member.
+
+    :param int members: number of stack members
+    :return: show version output
+    :rtype: str
+    """
+    rows = "".join(f"{'*' if number == 1 else ' '}{number:>5} 52    C9300-48P          16.9.4            CAT9K_IOSXE"
+                   f"           INSTALL\n" for number in range(1, members + 1))
+    sections = "".join(MEMBER.format(number=number) for number in range(2, members + 1))
+    return (HEADER.format(members=members, ports=members * 52) + rows + DETAILS.format(number=1) + sections +
+            "\nConfiguration register is 0x102\n")
+
+
+def former_version_detail(version_info: str, detail: str) -> str | None:
+    """
+    Former parser: scan a whole output for a single detail, serial number or model.
+
+    :param str version_info: device version info object
+    :param str detail: version detail indicator: serial or model
+    :return: requested detail, ``None`` if not found
+    :rtype: str or None
+    """
+    info = None
+    if detail == 'serial':
+        for line in version_info.splitlines():
+            if "System Serial Number" in line or "System serial" in line:
+                info = line.split()[-1]
+    if detail == 'model':
+        for line in version_info.splitlines():
+            if "cisco" in line.lower() and ("processor" in line.lower() or "chassis" in line.lower()):
+                parts = line.split()
+                if len(parts) >= 2:
+                    info = parts[1]
+    return info
+
+
+def former_parser(version_info: str) -> dict[str, str]:
+    """
+    Former per device parsing: one scan for a serial number, another one for a model.
+
+    :param str version_info: device version info object
+    :return: found version details dict
+    :rtype: dict[str, str]
+    """
+    return {'serial': former_version_detail(version_info, 'serial'),
+            'model': former_version_detail(version_info, 'model')}
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="show version parser micro-benchmark")
+    arguments.add_argument('--members', type=int, default=9, help="number of stack members (default: 9)")
+    arguments.add_argument('--iterations', type=int, default=2000, help="parses per parser (default: 2000)")
+    options = arguments.parse_args()
+
+    version_info = build_output(options.members)
+    print(f"show version output: {len(version_info.splitlines())} line(s), {options.iterations} parse(s) each")
+    for name, parser in (('former', former_parser), ('single pass', main.parse_cisco_version)):
+        started = time.perf_counter()
+        for _ in range(options.iterations):
+            info = parser(version_info)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<11} {elapsed:6.3f}s ({elapsed / options.iterations * 1e6:7.1f} us/parse),"
+              f" {len(info)} detail(s): {info}")
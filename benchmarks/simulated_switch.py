@@ -0,0 +1,161 @@
+"""
+Simulated Cisco IOS switch used by benchmarks: an asyncssh server accepting any credentials on every loopback
+address (127.0.0.1, 127.0.0.2, ...), so each address stands for a separate device. An interactive shell answers
+paging, ``show version`` and ``show interfaces status`` commands after a configurable delay, imitating device CPU.
+
+Run standalone to keep a switch listening: ``python benchmarks/simulated_switch.py --port 8022``
+"""
+import time
+import asyncio
+import argparse
+import multiprocessing
+from typing import Any
+
+import asyncssh
+
+# device prompt, as printed by an IOS switch in a privileged mode
+PROMPT = "sw1#"
+# show version output holding a serial number and a model
+VERSION = """Cisco IOS Software, C2960X Software (C2960X-UNIVERSALK9-M), Version 15.2(2)E7, RELEASE SOFTWARE (fc3)
+ROM: Bootstrap program is C2960X boot loader
+sw1 uptime is 1 year, 2 weeks, 3 days, 4 hours, 5 minutes
+cisco WS-C2960X-48FPD-L (APM86XXX) processor (revision D0) with 524288K bytes of memory.
+Base ethernet MAC Address       : 00:11:22:33:44:55
+Model number                    : WS-C2960X-48FPD-L
+System serial number            : FOC1234X0AB
+"""
+
+
+def show_interfaces_status(ports: int) -> str:
+    """
+    Build ``show interfaces status`` output of a switch with a provided number of ports.
+
+    :param int ports: number of switch ports
+    :return: show interfaces status output
+    :rtype: str
+    """
+    lines = ["Port      Name               Status       Vlan       Duplex  Speed Type"]
+    for index in range(1, ports + 1):
+        status = 'connected' if index % 3 else 'notconnect'
+        lines.append(f"Gi1/0/{index:<3}  {'':<18} {status:<12} {'1':<10} {'a-full':<7} {'a-1000':<5}"
+                     f" 10/100/1000BaseTX")
+    return "\n".join(lines) + "\n"
+
+
+def respond(command: str, ports: int) -> str:
+    """
+    Return output of a single command, as printed by an IOS switch.
+
+    :param str command: command received
+    :param int ports: number of switch ports
+    :return: command output
+    :rtype: str
+    """
+    if command in ("", "exit") or command.startswith("terminal "):
+        return ""
+    if command == "show version":
+        return VERSION
+    if command == "show interfaces status":
+        return show_interfaces_status(ports)
+    return "% Invalid input detected at '^' marker.\n"
+
+
+async def serve_shell(process: asyncssh.SSHServerProcess, ports: int, delay: float) -> None:
+    """
+    Interactive shell session: print a prompt, then echo and answer each command line until ``exit`` or end of
+    input. Lines are echoed by a session itself, as by a device CLI, with terminal line endings.
+
+    :param process: asyncssh server process
+    :param int ports: number of switch ports
+    :param float delay: command processing delay, in seconds
+    """
+    process.stdout.write(f"\r\n{PROMPT}")
+    while True:
+        line = await process.stdin.readline()
+        if not line:
+            break
+        command = line.strip()
+        process.stdout.write(f"{command}\r\n")
+        if command == "exit":
+            break
+        if command:
+            await asyncio.sleep(delay)
+        process.stdout.write(respond(command, ports).replace("\n", "\r\n") + PROMPT)
+    process.exit(0)
+
+
+class SwitchServer(asyncssh.SSHServer):
+    """
+    SSH server accepting any username and password.
+    """
+
+    def begin_auth(self, username: str) -> bool:
+        return True
+
+    def password_auth_supported(self) -> bool:
+        return True
+
+    def validate_password(self, username: str, password: str) -> bool:
+        return True
+
+
+async def listen(port: int, ports: int, delay: float, ready: Any = None) -> None:
+    """
+    Listen for SSH connections on all addresses until cancelled.
+
+    :param int port: TCP port
+    :param int ports: number of switch ports
+    :param float delay: command processing delay, in seconds
+    :param ready: event set once a server is listening, optional
+    :type ready: multiprocessing.Event or None
+    """
+    server = await asyncssh.create_server(SwitchServer, '', port, server_host_keys=[asyncssh.generate_private_key(
+        'ssh-ed25519')], process_factory=lambda process: serve_shell(process, ports, delay), line_editor=False,
+        backlog=4096)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.wait_closed()
+
+
+def run(port: int, ports: int, delay: float, ready: Any = None) -> None:
+    """
+    Simulated switch process entry point.
+
+    :param int port: TCP port
+    :param int ports: number of switch ports
+    :param float delay: command processing delay, in seconds
+    :param ready: event set once a server is listening, optional
+    :type ready: multiprocessing.Event or None
+    """
+    asyncio.run(listen(port, ports, delay, ready))
+
+
+def start_switch(port: int, ports: int = 48, delay: float = 0.05) -> multiprocessing.Process:
+    """
+    Start a simulated switch in a separate process, so it does not share a GIL with a benchmarked collector.
+
+    :param int port: TCP port
+    :param int ports: number of switch ports
+    :param float delay: command processing delay, in seconds
+    :return: simulated switch process, terminate it once done
+    :rtype: multiprocessing.Process
+    """
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(target=run, args=(port, ports, delay, ready), daemon=True)
+    process.start()
+    if not ready.wait(30):
+        process.terminate()
+        raise RuntimeError(f"simulated switch did not start listening on port {port}")
+    # give a listening socket a moment before a connection burst
+    time.sleep(0.2)
+    return process
+
+
+if __name__ == '__main__':
+    arguments = argparse.ArgumentParser(description="Simulated Cisco IOS switch")
+    arguments.add_argument('--port', type=int, default=8022, help="TCP port (default: 8022)")
+    arguments.add_argument('--ports', type=int, default=48, help="number of switch ports (default: 48)")
+    arguments.add_argument('--delay', type=float, default=0.05, help="command delay in seconds (default: 0.05)")
+    options = arguments.parse_args()
+    run(options.port, options.ports, options.delay)
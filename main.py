@@ -15,14 +15,136 @@ per device type as suggested in a config template created on a script first run,
 """
 
 # import libraries
+import os
+import sys
+import re
 import csv
 import time
+import gzip
 import json
+import hashlib
+import heapq
+import random
+import socket
+import asyncio
+import sqlite3
 import logging
-from typing import Any
+import argparse
+import threading
+import multiprocessing
+from typing import Any, Callable, Iterator
+from contextlib import closing, nullcontext
 from pathlib import Path
 from datetime import datetime
-from netmiko import ConnectHandler, NetMikoTimeoutException, NetMikoAuthenticationException
+from functools import partial
+from collections import deque, Counter
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from netmiko import ConnectHandler, NetMikoTimeoutException, NetMikoAuthenticationException, ReadTimeout
+from netmiko.utilities import get_structured_data, get_template_dir
+from textfsm import TextFSM, clitable
+
+# optional asyncio collection engine dependency
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+# optional columnar export dependency
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+# optional zstd compressed export dependency
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# device outcome observer: called with request details dict, processing time and failure kind (or None)
+DeviceObserver = Callable[[dict[str, Any], float, str | None], None]
+# device details sink: called once per device with request details dict and device details (or None)
+DeviceSink = Callable[[dict[str, Any], 'DeviceDetails | None'], None]
+# failure kinds worth retrying within a single run
+TRANSIENT_FAILURES = ('timeout', 'reset')
+# exceptions of an established netmiko session indicating a dropped channel
+TRANSIENT_ERRORS = (EOFError, OSError, ReadTimeout)
+# default transient failures retry settings, retries are disabled by default
+DEFAULT_RETRY = {'retries': 0, 'base_delay': 5, 'max_delay': 120}
+# connection and command output read timeouts used by the asyncio collection engine, in seconds
+ASYNC_CONNECT_TIMEOUT = 20
+ASYNC_READ_TIMEOUT = 60
+# device prompt closing an interactive shell output: hostname followed by # (privileged) or > (user mode)
+PROMPT_PATTERN = re.compile(r"[\w.\-@()/:~]+[#>]\s*")
+# default connection budget per parallel connection, applied when [rate_limit] is not configured: one login per second
+DEFAULT_RATE_LIMIT = {'rate': 1, 'burst': 1}
+# default distributed work queue settings, queue is disabled if no path is provided
+DEFAULT_QUEUE = {'path': '', 'lease': 900, 'idle_timeout': 60, 'poll_interval': 5}
+# device status report subject and header, listing devices not queried for their details
+STATUS_SUBJECT = 'status'
+STATUS_HEADER = ['IP', 'DeviceType', 'Status']
+# device report header, used for each exported file, grouped by a device type
+DEVICE_HEADER = ['IP', 'SN', 'Model', 'Port', 'PortStatus']
+# delta report subject and header, listing ports added, removed or changed since a previous run
+DELTA_SUBJECT = 'delta'
+DELTA_HEADER = ['IP', 'Port', 'PreviousStatus', 'PortStatus', 'Change']
+# default report export settings: csv or parquet format
+DEFAULT_EXPORT = {'format': 'csv', 'compression': '', 'append': False}
+# csv report file name extensions per compression
+CSV_EXTENSIONS = {'': '', 'gzip': '.gz', 'zstd': '.zst'}
+# parquet report columns with repeated values, dictionary encoded
+PARQUET_DICTIONARY_COLUMNS = ('IP', 'Model', 'PortStatus', 'PreviousStatus', 'Change', 'DeviceType', 'Status')
+# default pre-flight reachability sweep settings
+DEFAULT_PREFLIGHT = {'enabled': False, 'port': 22, 'timeout': 2, 'concurrency': 500, 'action': 'drop'}
+# default circuit breaker settings: retry window starts at base_delay and doubles per failure up to max_delay
+DEFAULT_BREAKER = {'enabled': False, 'path': 'breaker.sqlite', 'base_delay': 900, 'max_delay': 86400}
+# default checkpoint settings: collected device details are kept on disk, so an interrupted run can be resumed
+DEFAULT_CHECKPOINT = {'enabled': True, 'path': 'checkpoint.sqlite'}
+# default version cache settings: ports_only skips show version of devices checked within ttl seconds
+DEFAULT_VERSION_CACHE = {'enabled': False, 'path': 'version_cache.sqlite', 'ports_only': False, 'ttl': 86400}
+# default delta report settings: last known ports of each device are kept in a state file
+DEFAULT_DELTA = {'enabled': False, 'path': 'delta_state.sqlite'}
+# default inventory store settings: device and port history of all runs kept in a SQLite file
+DEFAULT_INVENTORY = {'enabled': False, 'path': 'inventory.sqlite'}
+# default raw output capture settings: latest outputs of each device kept compressed, identical outputs stored once
+DEFAULT_CAPTURE = {'enabled': False, 'path': 'captures.sqlite'}
+# inventory store: number of buffered ports inserted within a single transaction
+INVENTORY_BATCH_PORTS = 5000
+# default parse pool settings: number of parser processes (0 - outputs parsed by connection workers)
+# and maximum number of device outputs handed over to parser processes at once
+DEFAULT_PARSE_POOL = {'processes': 0, 'queue_depth': 100}
+# script level request options, not passed to a netmiko connection handler
+REQUEST_OPTIONS = ('batch_commands', 'minimal_session', 'version_cache', 'capture')
+# fast netmiko profile applied to device types listed in [fast_profile], each value can be overridden per device type
+# minimal_session limits session preparation to a prompt detection (and paging disable if commands are not batched)
+# with fast_cli, netmiko 4 reduces only a default global_delay_factor of 1 to 0.1, so a lower value is set explicitly
+FAST_PROFILE = {'fast_cli': True, 'global_delay_factor': 0.1, 'conn_timeout': 10, 'read_timeout_override': 30,
+                'minimal_session': True}
+# paging disable commands sent ahead of batched commands, per device type
+PAGING_COMMANDS = {'aruba_os': 'no paging', 'aruba_osswitch': 'no page', 'hp_procurve': 'no page'}
+# batched commands output read timeout, in seconds
+BATCH_READ_TIMEOUT = 60
+# adaptive concurrency: back off once recent latency exceeds its long-term baseline by this factor
+ADAPTIVE_LATENCY_FACTOR = 2.0
+# adaptive concurrency: back off once this ratio of recent devices failed with timeouts or authentication errors
+ADAPTIVE_FAILURE_RATIO = 0.25
+# adaptive concurrency: number of recent devices considered
+ADAPTIVE_WINDOW = 20
+# ArubaOS show version details: "ArubaOS (MODEL: ...), Version ..." header and "Switch uptime is ..." record
+ARUBAOS_VERSION_PATTERNS = {
+    'model': re.compile(r"\(MODEL:\s*([^)\s]+)\)"),
+    'version': re.compile(r"\bVersion\s+([^\s,]+)"),
+    'uptime': re.compile(r"\buptime is\s+(.+?)\s*$"),
+}
+# ArubaOS-Switch show version image stamp version line, e.g. "KB.16.08.0001"
+ARUBA_SWITCH_IMAGE_PATTERN = re.compile(r"^\s*([A-Z]{1,2}\.\d{2}\.\d{2}\.\d{4})\s*$")
+# show version parsers per device type, with details present in their output, filled in by ``register_version_parser``
+VERSION_PARSERS: dict[str, tuple[Callable[[str], dict[str, str]], tuple[str, ...]]] = {}
+# show version parser used for device types without a registered parser
+DEFAULT_VERSION_PARSER = 'cisco_ios'
+# show version details names
+VERSION_DETAILS = ('serial', 'model', 'version', 'uptime')
 
 
 def main() -> None:
@@ -31,16 +153,46 @@ def main() -> None:
     Check for a config file if it is present within script directory, create one as a template if not present.
     Check for a switches IP list file as well before any action is taken.
     Proceed if all criteria are met.
+    Run as a distributed queue worker only, if requested with a ``--worker`` argument.
+    Skip devices collected by an interrupted run, if requested with a ``--resume`` argument.
+    Rebuild reports from captured raw outputs without connecting to devices, if requested with a ``--reparse``
+    argument.
     """
+    arguments = parse_arguments()
     # create log object
     log = check_for_log()
     log.info("new script instance running")
     # config file check and import (if possible)
     _config = check_for_configuration(log)
-    # perform actions if previous actions successful
-    data = execute_data_requests(log, _config)
-    # perform export
-    export_data(log, data)
+    # process queued device jobs of other script instances, no export is performed by a worker
+    if arguments.worker:
+        execute_queue_worker(log, _config)
+        return
+    # perform actions if previous actions successful, devices are exported as soon as processed
+    writer = get_report_writer(log, _config)
+    if arguments.reparse:
+        execute_reparse(log, _config, writer)
+    else:
+        execute_data_requests(log, _config, writer, arguments.resume)
+    # finish export
+    export_data(log, writer)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse script command line arguments.
+
+    :return: parsed arguments
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description="Switch inventory report")
+    parser.add_argument('--worker', action='store_true',
+                        help="process device jobs from a distributed work queue configured in [config.json]")
+    parser.add_argument('--resume', action='store_true',
+                        help="resume an interrupted run: devices already collected by it are not queried again")
+    parser.add_argument('--reparse', action='store_true',
+                        help="rebuild reports from captured raw outputs, without connecting to devices")
+    return parser.parse_args()
 
 
 # ---------------------------------
@@ -129,8 +281,47 @@ def get_file_template() -> dict[str, Any]:
     # default config file structure
     # IMPORTANT: specify IP addresses of devices matching switch type
     # IMPORTANT: switch types can be configured freely
+    # IMPORTANT: max_workers sets the number of devices queried in parallel, 1 keeps serial execution
+    # IMPORTANT: engine selects connection library: netmiko (threads) or asyncssh (single event loop)
+    # IMPORTANT: rate_limit sets logins per second and burst size, globally and per device type (0 disables limit)
+    # IMPORTANT: if rate_limit is not set, each parallel connection adds one login per second and one to a burst
+    # IMPORTANT: processes sets the number of worker processes devices are sharded across, "auto" uses all CPU cores
+    # IMPORTANT: parse_pool processes parse raw outputs apart from connection workers (single process only, 0 disables)
+    # IMPORTANT: queue path enables distributed collection via a shared SQLite file, empty path disables it
+    # IMPORTANT: bulkheads run listed device types in separate pools: {type: {max_workers, queue_depth}}
+    # IMPORTANT: adaptive adjusts parallel connections between min and max workers, starting from max_workers
+    # IMPORTANT: batch_commands sends all commands in a single channel write (netmiko engine)
+    # IMPORTANT: fast_profile applies tuned netmiko timing to listed device types: {type: {overrides}}
+    # IMPORTANT: preflight probes ssh port of all devices before login, dropping or deferring unreachable ones
+    # IMPORTANT: breaker skips devices failing with timeouts or authentication errors until a retry window elapses
+    # IMPORTANT: retry re-queues devices failing with timeouts or connection resets, with a jittered back-off
+    # IMPORTANT: checkpoint stores collected devices on disk, a run started with --resume skips them
+    # IMPORTANT: version_cache keeps serial and model per device, ports_only skips show version until ttl expires
+    # IMPORTANT: delta exports only ports added, removed or changed since a previous run instead of full reports
+    # IMPORTANT: inventory stores devices and ports of each run in a SQLite file, alongside exported reports
+    # IMPORTANT: capture stores raw outputs of each device, a run started with --reparse rebuilds reports from them
+    # IMPORTANT: export format selects report files format: csv or parquet (requires pyarrow)
+    # IMPORTANT: export compression can be gzip or zstd, append adds csv rows to a daily file per device type
     return {'username': '',
             'password': '',
+            'max_workers': 1,
+            'processes': 1,
+            'parse_pool': dict(DEFAULT_PARSE_POOL),
+            'engine': 'netmiko',
+            'queue': dict(DEFAULT_QUEUE),
+            'bulkheads': {},
+            'adaptive': {'enabled': False, 'min_workers': 1, 'max_workers': 32},
+            'batch_commands': False,
+            'fast_profile': {},
+            'preflight': dict(DEFAULT_PREFLIGHT),
+            'breaker': dict(DEFAULT_BREAKER),
+            'retry': dict(DEFAULT_RETRY),
+            'checkpoint': dict(DEFAULT_CHECKPOINT),
+            'version_cache': dict(DEFAULT_VERSION_CACHE),
+            'delta': dict(DEFAULT_DELTA),
+            'inventory': dict(DEFAULT_INVENTORY),
+            'capture': dict(DEFAULT_CAPTURE),
+            'export': dict(DEFAULT_EXPORT),
             'devices': {'Cisco-IOS': ['192.168.1.1', '192.168.1.2']}
             }
 
@@ -138,20 +329,129 @@ def get_file_template() -> dict[str, Any]:
 # ---------------------------------
 # main script activities
 # ---------------------------------
-def execute_data_requests(log: logging.Logger, _config: dict[str, Any]) -> dict[str, Any] | None:
+def execute_data_requests(log: logging.Logger, _config: dict[str, Any], writer: 'ReportWriter',
+                          resume: bool = False) -> None:
     """
     Per each device from switches list execute software upgrade actions.
+    Details of each device are checkpointed as soon as obtained and written to a report in a config order, so
+    collected devices are not held in memory until a run ends; if resuming, devices collected by an interrupted run
+    are restored from a checkpoint instead of being queried again. In a delta mode, only port changes since
+    a previous run are reported. If enabled, devices are stored in an inventory store as well.
 
     :param log: log object
     :param _config: configuration file content dict
+    :param writer: report writer
+    :param bool resume: resume an interrupted run
     :type log: logging.Logger
     :type: _config: dict[str, Any]
-    :return: device data, optional
-    :rtype: dict[str, Any] or None
+    :type writer: ReportWriter
+    :raise Exception: ``exc`` config data retrieval issue, check `config.json` file content
+    """
+    # obtain devices from config, validate credentials
+    _, _, _devices = get_credentials(log, _config)
+    # obtain checkpoint of collected devices, a new run starts it over
+    checkpoint = get_checkpoint(log, _config)
+    # in a delta mode, only port changes are exported instead of full device reports
+    delta = get_delta_report(log, _config, writer)
+    # inventory store keeps devices of all runs, alongside reports
+    store = get_inventory_store(log, _config)
+    report = combine_sinks(log, [delta.record if delta else writer.record, store.record if store else None])
+    # devices are exported in a config order, a device processed ahead of its turn waits for earlier ones
+    ordered = OrderedSink(report)
+    # each device is checkpointed as soon as processed
+    sink = combine_sinks(log, [ordered.record, checkpoint.record if checkpoint else None])
+    # obtain device collector, as configured
+    collector = get_collector(log, _config, sink)
+    # obtain pre-flight reachability sweep settings
+    preflight = get_preflight_settings(log, _config)
+    # obtain circuit breaker of devices which failed in previous runs
+    breaker = get_circuit_breaker(log, _config)
+
+    # create device details dictionaries for connection setting, grouped by device type as in a config file
+    # these will be used with netmiko library connection handler
+    requests = [build_request(device_type, device, _config)
+                for device_type in _devices for device in _devices[device_type]]
+    if checkpoint and resume:
+        requests = checkpoint.split_requests(log, requests, report)
+    elif checkpoint:
+        checkpoint.clear(log)
+    elif resume:
+        log.warning("checkpoint is not enabled, nothing to resume: all devices will be queried")
+    # skip devices known to fail until their retry window elapses
+    # devices not queried for their details are listed in a separate status report
+    if breaker:
+        requests, skipped = breaker.split_requests(log, requests)
+        writer.write(STATUS_SUBJECT, STATUS_HEADER,
+                     [[_json['host'], _json['device_type'], "skipped (breaker open)"] for _json in skipped])
+    # probe devices reachability, so unreachable devices do not cost a full connection timeout each
+    unreachable = []
+    if preflight:
+        requests, unreachable = sweep_requests(log, requests, preflight)
+    # process connections, details of each device are handed over to a sink as soon as obtained
+    ordered.expect(requests)
+    dispatch_requests(log, requests, _config, collector, sink)
+    ordered.flush()
+    # deferred devices are probed once more after all reachable devices are processed
+    if unreachable and preflight['action'] == 'defer':
+        log.info(f"probing {len(unreachable)} deferred device(s) again")
+        recovered, unreachable = sweep_requests(log, unreachable, preflight)
+        ordered.expect(recovered)
+        dispatch_requests(log, recovered, _config, collector, sink)
+        ordered.flush()
+    writer.write(STATUS_SUBJECT, STATUS_HEADER, [[_json['host'], _json['device_type'],
+                                                  f"unreachable (tcp/{preflight['port']})"] for _json in unreachable])
+    # devices unreachable in a sweep count as timed out for a circuit breaker
+    if breaker:
+        for _json in unreachable:
+            breaker.observe(_json, 0.0, 'timeout')
+    if store:
+        store.close(log)
+    # a finished run is not resumed, a next --resume run queries all devices again
+    if checkpoint:
+        checkpoint.complete()
+
+
+def dispatch_requests(log: logging.Logger, requests: list[dict[str, Any]], _config: dict[str, Any],
+                      collector: Callable[[list[dict[str, Any]]], list['DeviceDetails | None']],
+                      sink: DeviceSink | None = None) -> list['DeviceDetails | None']:
+    """
+    Obtain details of provided devices with a local collector or, if a queue is configured, sharing devices
+    with worker script instances. Results are returned in the same order as provided requests; if a sink is
+    provided, details are handed over to it instead.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param _config: configuration file content dict
+    :param collector: devices collector function
+    :param sink: device details sink, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type: _config: dict[str, Any]
+    :type collector: Callable[[list[dict[str, Any]]], list[DeviceDetails | None]]
+    :type sink: DeviceSink or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    if not requests:
+        return []
+    if get_queue_settings(_config)['path']:
+        return collect_devices_distributed(log, requests, _config, collector, sink)
+    return collector(requests)
+
+
+def get_credentials(log: logging.Logger, _config: dict[str, Any]) -> tuple[str, str, dict[str, list[str]]]:
+    """
+    Read credentials and devices from a config file content.
+    Exit script execution if data cannot be read or credentials are not provided.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: username, password and devices list per device type
+    :rtype: tuple[str, str, dict[str, list[str]]]
     :raise Exception: ``exc`` config data retrieval issue, check `config.json` file content
     """
-    data = {}
-    # obtain credentials from config
     try:
         log.info(f"reading data from [config.json]")
         _username = _config['username']
@@ -165,183 +465,3364 @@ def execute_data_requests(log: logging.Logger, _config: dict[str, Any]) -> dict[
     if not _username and not _password:
         log.warning(f"credentials not provided, script will now exit.")
         exit()
+    return _username, _password, _devices
+
+
+def build_request(device_type: str, host: str, _config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create device request details dict for connection setting, with script level request options as configured.
+    Device types listed in ``fast_profile`` get tuned netmiko timing settings, as overridden in a config file.
+    If enabled, version cache and capture settings are passed along, so whichever process queries or parses a device
+    uses them.
+
+    :param str device_type: netmiko device type
+    :param str host: device IP address
+    :param _config: configuration file content dict
+    :type: _config: dict[str, Any]
+    :return: request details dict
+    :rtype: dict[str, Any]
+    """
+    _json = {"device_type": device_type, "host": host, "username": _config['username'],
+             "password": _config['password']}
+    if _config.get('batch_commands'):
+        _json['batch_commands'] = True
+    version_cache = get_version_cache_settings(_config)
+    if version_cache:
+        _json['version_cache'] = version_cache
+    capture = get_capture_settings(_config)
+    if capture:
+        _json['capture'] = capture
+    fast_profile = (_config.get('fast_profile') or {}).get(device_type)
+    if isinstance(fast_profile, dict):
+        # only known profile settings are applied, so a typo does not reach netmiko connection handler
+        _json.update({key: fast_profile.get(key, value) for key, value in FAST_PROFILE.items()})
+    return _json
+
+
+def get_connection_details(_json: dict[str, Any]) -> dict[str, Any]:
+    """
+    Strip script level request options from request details, leaving netmiko connection handler arguments.
+
+    :param _json: request details dict
+    :type _json: dict[str, Any]
+    :return: netmiko connection handler arguments
+    :rtype: dict[str, Any]
+    """
+    return {key: value for key, value in _json.items() if key not in REQUEST_OPTIONS}
+
+
+def get_collector(log: logging.Logger, _config: dict[str, Any],
+                  sink: DeviceSink | None = None) -> Callable[[list[dict[str, Any]]], list['DeviceDetails | None']]:
+    """
+    Read collection settings from a config file content once, return a function obtaining details of provided
+    devices with those settings: worker processes, parallel connections, engine, connection rate limit,
+    per device type bulkheads, adaptive concurrency, circuit breaker, transient failures retries and parse pool.
+    Provided sink receives details of each device as soon as the device is processed.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param sink: device details sink, optional
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :type sink: DeviceSink or None
+    :return: devices collector function, taking a list of request details dicts
+    :rtype: Callable[[list[dict[str, Any]]], list[DeviceDetails | None]]
+    """
+    # obtain number of parallel connections, fall back to serial execution if incorrectly provided
+    _max_workers = get_max_workers(log, _config)
+    # obtain collection engine
+    _engine = get_engine(log, _config)
+    # obtain number of worker processes, devices are sharded across processes if more than one
+    # parsing is spread across worker processes already, so a parse pool is not started
+    _processes = get_processes(log, _config)
+    if _processes > 1:
+        return partial(collect_devices_sharded, log, _config=_config, processes=_processes, sink=sink)
+    # obtain parse pool settings, raw outputs are parsed apart from connection workers if enabled
+    _parsing = get_parse_pool_settings(log, _config)
+    # obtain per device type concurrency limits
+    _bulkheads = get_bulkheads(log, _config, _max_workers)
+    # obtain connection rate limiter protecting AAA servers and adaptive concurrency controller,
+    # both shared by all batches of this script instance
+    # circuit breaker records device failures, whichever process or script instance queried a device
+    breaker = get_circuit_breaker(log, _config)
+    controller = get_adaptive_controller(log, _config, _max_workers, _bulkheads)
+    # bulkheads query their device types alongside other devices, an adaptive level may rise above max_workers
+    connections = _max_workers + sum(bulkhead['max_workers'] for bulkhead in _bulkheads.values())
+    if controller:
+        connections = max(connections, controller.max_workers)
+    return partial(collect_devices, log, max_workers=_max_workers, engine=_engine,
+                   limiter=get_rate_limiter(log, _config, connections), bulkheads=_bulkheads, controller=controller,
+                   observer=breaker.observe if breaker else None, retry=get_retry_settings(log, _config), sink=sink,
+                   parsing=_parsing)
+
+
+def get_max_workers(log: logging.Logger, _config: dict[str, Any]) -> int:
+    """
+    Read number of devices to be queried in parallel from a config file content.
+    Fall back to a serial execution if value is missing or incorrect.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: number of worker threads
+    :rtype: int
+    """
+    max_workers = _config.get('max_workers', 1)
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        log.warning(f"incorrect [max_workers] value: {max_workers}, devices will be queried one at a time")
+        return 1
+    log.info(f"devices will be queried with {max_workers} parallel connection(s)")
+    return max_workers
+
+
+def get_processes(log: logging.Logger, _config: dict[str, Any]) -> int:
+    """
+    Read number of worker processes from a config file content, ``auto`` matches available CPU cores.
+    Fall back to a single process if value is missing or incorrect.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: number of worker processes
+    :rtype: int
+    """
+    processes = _config.get('processes', 1)
+    if processes == 'auto':
+        processes = os.cpu_count() or 1
+    if not isinstance(processes, int) or isinstance(processes, bool) or processes < 1:
+        log.warning(f"incorrect [processes] value: {processes}, devices will be queried from a single process")
+        return 1
+    if processes > 1:
+        log.info(f"devices will be sharded across {processes} worker processes")
+    return processes
+
+
+def get_bulkheads(log: logging.Logger, _config: dict[str, Any], max_workers: int) -> dict[str, dict[str, int]]:
+    """
+    Read per device type bulkheads from a config file content: maximum number of devices of a type queried in
+    parallel and number of devices waiting for a free connection slot. Missing values default to ``max_workers``
+    and ``0`` respectively. Incorrectly configured device types are skipped.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param int max_workers: default number of devices queried in parallel
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: bulkhead settings per device type
+    :rtype: dict[str, dict[str, int]]
+    """
+    bulkheads = {}
+    for device_type, settings in (_config.get('bulkheads') or {}).items():
+        if isinstance(settings, dict):
+            bulkhead = {'max_workers': settings.get('max_workers', max_workers),
+                        'queue_depth': settings.get('queue_depth', 0)}
+        else:
+            bulkhead = {'max_workers': 0, 'queue_depth': 0}
+        if not all(isinstance(value, int) and not isinstance(value, bool) for value in bulkhead.values()) \
+                or bulkhead['max_workers'] < 1 or bulkhead['queue_depth'] < 0:
+            log.warning(f"incorrect [bulkheads] value for {device_type}: {settings}, skipping")
+            continue
+        bulkheads[device_type] = bulkhead
+    if bulkheads:
+        log.info(f"device types queried in separate bulkheads: {', '.join(bulkheads)}")
+    return bulkheads
+
+
+def get_retry_settings(log: logging.Logger, _config: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Read transient failures retry settings from a config file content, completed with default values.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: retry settings dict, ``None`` if retries are not enabled
+    :rtype: dict[str, Any] or None
+    """
+    settings = {**DEFAULT_RETRY, **(_config.get('retry') or {})}
+    if not settings['retries']:
+        return None
+    if not isinstance(settings['retries'], int) or settings['retries'] < 0 \
+            or not all(isinstance(settings[key], (int, float)) for key in ('base_delay', 'max_delay')):
+        log.warning(f"incorrect [retry] value: {settings}, transient failures will not be retried")
+        return None
+    log.info(f"transient failures will be retried up to {settings['retries']} time(s)")
+    return settings
+
+
+def get_engine(log: logging.Logger, _config: dict[str, Any]) -> str:
+    """
+    Read collection engine name from a config file content.
+    Fall back to a netmiko engine if value is incorrect or optional ``asyncssh`` library is not installed.
 
-    # proceed with execution of commands per devices as grouped by OS version in a [switches.json] file
-    for device_type in _devices:
-        # prepare default data header
-        # this will be used for each exported file, grouped by a device type
-        results = [['IP', 'SN', 'Model', 'Port', 'PortStatus']]
-        for device in _devices[device_type]:
-            log.info(f"-------------------")
-            log.info(f"DEVICE IP: {device}")
-            # create device details dictionary for connection setting
-            # this will be used with netmiko library connection handler
-            _json = {"device_type": device_type, "host": device, "username": _username, "password": _password}
-            # process connection, return obtained data
-            _details = get_switch_details(log, _json)
-            if _details:
-                results.extend(_details)
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: collection engine name
+    :rtype: str
+    """
+    engine = _config.get('engine', 'netmiko')
+    if engine not in ('netmiko', 'asyncssh'):
+        log.warning(f"incorrect [engine] value: {engine}, netmiko engine will be used")
+        return 'netmiko'
+    if engine == 'asyncssh' and asyncssh is None:
+        log.warning(f"asyncssh engine requested but library is not installed (pip install asyncssh),"
+                    f" netmiko engine will be used")
+        return 'netmiko'
+    log.info(f"devices will be queried with {engine} engine")
+    return engine
+
+
+def collect_devices(log: logging.Logger, requests: list[dict[str, Any]], max_workers: int,
+                    engine: str = 'netmiko', limiter: 'RateLimiter | None' = None,
+                    bulkheads: dict[str, dict[str, int]] | None = None,
+                    controller: 'AdaptiveController | None' = None,
+                    observer: DeviceObserver | None = None,
+                    retry: dict[str, Any] | None = None,
+                    sink: DeviceSink | None = None,
+                    parsing: dict[str, int] | None = None) -> list['DeviceDetails | None']:
+    """
+    Obtain details of all provided devices, either with a bounded thread pool (a single worker keeps devices
+    queried one at a time) or within a single asyncio event loop. Results are returned in the same order as
+    provided requests, regardless of connections completion order.
+    If bulkheads are configured, each device type is queried in its own pool, so a slow device type does not
+    starve the others; device types not listed in bulkheads use ``max_workers`` connections each.
+    Otherwise, if an adaptive controller is provided, number of parallel connections follows its current level.
+    If parse pool settings are provided, raw outputs are parsed in a process pool started for this collection.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param max_workers: maximum number of devices queried in parallel
+    :param engine: collection engine name: netmiko or asyncssh
+    :param limiter: connection rate limiter, optional
+    :param bulkheads: bulkhead settings per device type, optional
+    :param controller: adaptive concurrency controller, optional
+    :param observer: device final outcome observer, notified once retries are over, optional
+    :param retry: transient failures retry settings, optional
+    :param sink: device details sink, optional
+    :param parsing: parse pool settings, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type max_workers: int
+    :type engine: str
+    :type limiter: RateLimiter or None
+    :type bulkheads: dict[str, dict[str, int]] or None
+    :type controller: AdaptiveController or None
+    :type observer: DeviceObserver or None
+    :type retry: dict[str, Any] or None
+    :type sink: DeviceSink or None
+    :type parsing: dict[str, int] or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    with ParsePool(log, **parsing) if parsing else nullcontext() as parser:
+        # asyncio engine: one event loop keeps all sessions in flight
+        if engine == 'asyncssh':
+            return asyncio.run(collect_devices_async(log, requests, max_workers, limiter, bulkheads, controller,
+                                                     observer, retry, sink, parser))
+        # bulkheads: one pool per device type
+        if bulkheads:
+            return collect_devices_bulkheads(log, requests, max_workers, limiter, bulkheads, observer, retry, sink,
+                                             parser)
+        # adaptive execution: number of devices in flight follows controller level, controller observes each attempt
+        if controller:
+            return dispatch_pool(log, requests, controller.max_workers, lambda: controller.level, limiter,
+                                 controller.observe, observer, retry, sink, parser)
+        # fixed number of devices in flight
+        return dispatch_pool(log, requests, max_workers, lambda: max_workers, limiter, None, observer, retry, sink,
+                             parser)
+
+
+def collect_devices_bulkheads(log: logging.Logger, requests: list[dict[str, Any]], max_workers: int,
+                              limiter: 'RateLimiter | None', bulkheads: dict[str, dict[str, int]],
+                              observer: DeviceObserver | None = None,
+                              retry: dict[str, Any] | None = None,
+                              sink: DeviceSink | None = None,
+                              parser: 'ParsePool | None' = None) -> list['DeviceDetails | None']:
+    """
+    Obtain details of provided devices with a separate thread pool per device type, all pools running at once.
+    Each pool accepts up to its ``max_workers`` plus ``queue_depth`` devices at a time.
+    Log throughput of each device type once its devices are processed.
+    Results are returned in the same order as provided requests.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param max_workers: maximum number of devices queried in parallel for types not listed in bulkheads
+    :param limiter: connection rate limiter, optional
+    :param bulkheads: bulkhead settings per device type
+    :param observer: device final outcome observer, optional
+    :param retry: transient failures retry settings, optional
+    :param sink: device details sink, optional
+    :param parser: raw outputs parse pool, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type max_workers: int
+    :type limiter: RateLimiter or None
+    :type bulkheads: dict[str, dict[str, int]]
+    :type observer: DeviceObserver or None
+    :type retry: dict[str, Any] or None
+    :type sink: DeviceSink or None
+    :type parser: ParsePool or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    families = group_positions(requests)
+
+    def run_bulkhead(device_type: str) -> list['DeviceDetails | None']:
+        settings = bulkheads.get(device_type, {'max_workers': max_workers, 'queue_depth': 0})
+        started = time.monotonic()
+        capacity = settings['max_workers'] + settings['queue_depth']
+        # devices handed over to a sink are not returned, so obtained devices are counted by a dispatch loop
+        tally = Counter()
+        family_results = dispatch_pool(log, [requests[position] for position in families[device_type]],
+                                       settings['max_workers'], lambda: capacity, limiter, None, observer, retry,
+                                       sink, parser, tally)
+        log_throughput(log, device_type, tally['obtained'], len(family_results), time.monotonic() - started)
+        return family_results
+
+    results = [None] * len(requests)
+    with ThreadPoolExecutor(max_workers=max(1, len(families))) as executor:
+        for positions, family_results in zip(families.values(), executor.map(run_bulkhead, families)):
+            for position, _details in zip(positions, family_results):
+                results[position] = _details
+    return results
+
+
+def dispatch_pool(log: logging.Logger, requests: list[dict[str, Any]], workers: int, capacity: Callable[[], int],
+                  limiter: 'RateLimiter | None', attempt_observer: DeviceObserver | None,
+                  observer: DeviceObserver | None, retry: dict[str, Any] | None,
+                  sink: DeviceSink | None = None, parser: 'ParsePool | None' = None,
+                  tally: Counter | None = None) -> list['DeviceDetails | None']:
+    """
+    Obtain details of provided devices with a pool of ``workers`` threads, keeping as many devices in flight as
+    returned by ``capacity`` at a time. Devices failing with transient errors are put back at the tail of a work
+    queue after a jittered back-off, so waiting for a retry never blocks a worker. Outputs handed over to a parse pool
+    free a worker at once, an outcome of their device is settled by a parse pool callback once parsed.
+    Results are returned in the same order as provided requests; if a sink is provided, details of each device
+    are handed over to it as soon as its final outcome is known and ``None`` is returned in their place.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param int workers: number of worker threads
+    :param capacity: function returning current maximum number of devices in flight
+    :param limiter: connection rate limiter, optional
+    :param attempt_observer: observer notified of each connection attempt, optional
+    :param observer: device final outcome observer, optional
+    :param retry: transient failures retry settings, optional
+    :param sink: device details sink, optional
+    :param parser: raw outputs parse pool, optional
+    :param tally: counter of ``obtained`` devices, updated once a device final outcome is known, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type capacity: Callable[[], int]
+    :type limiter: RateLimiter or None
+    :type attempt_observer: DeviceObserver or None
+    :type observer: DeviceObserver or None
+    :type retry: dict[str, Any] or None
+    :type sink: DeviceSink or None
+    :type parser: ParsePool or None
+    :type tally: Counter or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    results = [None] * len(requests)
+    attempts = [0] * len(requests)
+    queue = deque(range(len(requests)))
+    delayed = []
+    in_flight = {}
+    # final outcomes are settled by a dispatch loop and parse pool callbacks, one at a time
+    settled = threading.Condition()
+    parsing = set()
+
+    def settle(position: int, details: 'DeviceDetails | None', failure: str | None, elapsed: float) -> None:
+        with settled:
+            if observer:
+                observer(requests[position], elapsed, failure)
+            if tally is not None and details:
+                tally['obtained'] += 1
+            # details handed over to a sink are not retained
+            if sink:
+                sink(requests[position], details)
             else:
-                log.warning(f"no device info obtained, skipping")
+                results[position] = details
+
+    def settle_parsed(position: int, elapsed: float, parsed: Future) -> None:
+        try:
+            details = parsed.result()
+            settle(position, details, None if details else 'error', elapsed)
+        finally:
+            with settled:
+                parsing.discard(position)
+                settled.notify()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(requests)))) as executor:
+        while queue or delayed or in_flight:
+            release_retries(queue, delayed)
+            # top up devices in flight to a current capacity
+            while queue and len(in_flight) < capacity():
+                position = queue.popleft()
+                future = executor.submit(attempt_device, log, requests[position], limiter, attempt_observer, parser)
+                in_flight[future] = position
+            # only retries waiting for their back-off left
+            if not in_flight:
+                time.sleep(retry_timeout(delayed))
                 continue
-        # validate data volume, append to dict
-        if len(results) > 1:
-            data[device_type] = results
-    # final data validation:
-    return data if data else None
+            done, _ = wait(in_flight, timeout=retry_timeout(delayed) if delayed else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                position = in_flight.pop(future)
+                details, failure, elapsed = future.result()
+                attempts[position] += 1
+                if isinstance(details, Future):
+                    with settled:
+                        parsing.add(position)
+                    details.add_done_callback(partial(settle_parsed, position, elapsed))
+                elif not schedule_retry(log, requests[position], failure, attempts[position], retry, delayed,
+                                        position):
+                    settle(position, details, failure, elapsed)
+    # wait for outputs still being parsed
+    with settled:
+        settled.wait_for(lambda: not parsing)
+    return results
+
+
+def attempt_device(log: logging.Logger, _json: dict[str, Any], limiter: 'RateLimiter | None',
+                   observer: DeviceObserver | None,
+                   parser: 'ParsePool | None' = None) -> tuple['DeviceDetails | Future | None', str | None, float]:
+    """
+    Single attempt to obtain device details, capturing its outcome. If outputs were handed over to a parse pool,
+    a future resolving to device details is returned in their place.
+
+    :param log: log object
+    :param _json: request details dict
+    :param limiter: connection rate limiter, optional
+    :param observer: observer notified of a connection attempt, optional
+    :param parser: raw outputs parse pool, optional
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :type limiter: RateLimiter or None
+    :type observer: DeviceObserver or None
+    :type parser: ParsePool or None
+    :return: device details or their future (optional), failure kind (optional) and processing time
+    :rtype: tuple[DeviceDetails | Future | None, str | None, float]
+    """
+    outcome = []
+    details = get_switch_details(log, _json, limiter, combine_observers([observer, capture_outcome(outcome)]), parser)
+    return details, outcome[1], outcome[0]
+
+
+def capture_outcome(outcome: list[Any]) -> DeviceObserver:
+    """
+    Create device outcome observer storing processing time and failure kind in a provided list.
+
+    :param outcome: list receiving processing time and failure kind
+    :type outcome: list[Any]
+    :return: device outcome observer
+    :rtype: DeviceObserver
+    """
+    def observer(_json: dict[str, Any], elapsed: float, failure: str | None) -> None:
+        outcome[:] = [elapsed, failure]
+
+    return observer
+
+
+def schedule_retry(log: logging.Logger, _json: dict[str, Any], failure: str | None, attempt: int,
+                   retry: dict[str, Any] | None, delayed: list[tuple[float, int]], position: int) -> bool:
+    """
+    Schedule another attempt of a device which failed with a transient error, if its retries are not used up.
+    Back-off doubles with each attempt, up to a configured maximum, and is jittered so that devices which failed
+    together do not retry together.
+
+    :param log: log object
+    :param _json: request details dict
+    :param failure: failure kind of a last attempt, optional
+    :param int attempt: number of attempts made so far
+    :param retry: transient failures retry settings, optional
+    :param delayed: heap of devices waiting for a retry: ready time and request position
+    :param int position: request position
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :type failure: str or None
+    :type retry: dict[str, Any] or None
+    :type delayed: list[tuple[float, int]]
+    :return: ``True`` if a retry was scheduled
+    :rtype: bool
+    """
+    if not retry or failure not in TRANSIENT_FAILURES or attempt > retry['retries']:
+        return False
+    backoff = min(retry['max_delay'], retry['base_delay'] * 2 ** (attempt - 1))
+    delay = backoff / 2 + random.uniform(0, backoff / 2)
+    log.info(f"> {_json['host']}: {failure} failure, retry {attempt}/{retry['retries']} in {delay:.1f}s")
+    heapq.heappush(delayed, (time.monotonic() + delay, position))
+    return True
+
+
+def release_retries(queue: deque, delayed: list[tuple[float, int]]) -> None:
+    """
+    Move devices whose retry back-off elapsed to the tail of a work queue.
+
+    :param queue: work queue of request positions
+    :param delayed: heap of devices waiting for a retry: ready time and request position
+    :type queue: deque
+    :type delayed: list[tuple[float, int]]
+    """
+    while delayed and delayed[0][0] <= time.monotonic():
+        queue.append(heapq.heappop(delayed)[1])
+
+
+def retry_timeout(delayed: list[tuple[float, int]]) -> float:
+    """
+    Return time left until a first retry back-off elapses.
+
+    :param delayed: heap of devices waiting for a retry: ready time and request position
+    :type delayed: list[tuple[float, int]]
+    :return: time in seconds, ``0`` if a retry is already due
+    :rtype: float
+    """
+    return max(0.0, delayed[0][0] - time.monotonic())
+
+
+def group_positions(requests: list[dict[str, Any]]) -> dict[str, list[int]]:
+    """
+    Group request positions per device type, keeping device types order of appearance.
+
+    :param requests: list of request details dicts, one per device
+    :type requests: list[dict[str, Any]]
+    :return: request positions per device type
+    :rtype: dict[str, list[int]]
+    """
+    families = {}
+    for position, _json in enumerate(requests):
+        families.setdefault(_json['device_type'], []).append(position)
+    return families
+
+
+def log_throughput(log: logging.Logger, device_type: str, obtained: int, total: int, elapsed: float) -> None:
+    """
+    Log collection throughput of a single device type.
+
+    :param log: log object
+    :param str device_type: netmiko device type
+    :param int obtained: number of devices with details obtained
+    :param int total: number of processed devices
+    :param float elapsed: device type collection time, in seconds
+    :type log: logging.Logger
+    """
+    log.info(f"> {device_type}: {obtained}/{total} device(s) obtained in {elapsed:.1f}s"
+             f" ({total / max(elapsed, 0.001):.2f} device(s)/s)")
+
+
+def collect_devices_sharded(log: logging.Logger, requests: list[dict[str, Any]], _config: dict[str, Any],
+                            processes: int, sink: DeviceSink | None = None) -> list['DeviceDetails | None']:
+    """
+    Shard provided devices across worker processes, each running its own concurrent collector.
+    Connection budgets and bulkheads are split evenly between processes, worker logs are forwarded to a main
+    process log handlers. Results are merged back in the same order as provided requests; if a sink is provided,
+    worker processes hand details of each device over to it through a queue, as soon as the device is processed.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param _config: configuration file content dict
+    :param processes: number of worker processes
+    :param sink: device details sink, called within a main process, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type: _config: dict[str, Any]
+    :type processes: int
+    :type sink: DeviceSink or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    shards_count = min(processes, len(requests))
+    if shards_count < 2:
+        return get_collector(log, {**_config, 'processes': 1}, sink)(requests)
+    # round-robin sharding keeps device types evenly spread between processes
+    shards = [requests[index::shards_count] for index in range(shards_count)]
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *log.handlers)
+    listener.start()
+    manager = multiprocessing.Manager() if sink else None
+    try:
+        # worker processes put device details into a managed queue, drained by a main process thread
+        worker_sink = None
+        if manager:
+            sink_queue = manager.Queue()
+            worker_sink = partial(put_device, sink_queue)
+            drainer = threading.Thread(target=drain_devices, args=(log, sink_queue, sink), daemon=True)
+            drainer.start()
+        try:
+            with ProcessPoolExecutor(max_workers=shards_count, initializer=init_worker_log,
+                                     initargs=(log_queue, log.name)) as executor:
+                shard_results = list(executor.map(partial(collect_shard, log.name,
+                                                          _config=split_config(_config, shards_count),
+                                                          sink=worker_sink), shards))
+        finally:
+            if manager:
+                sink_queue.put(None)
+                drainer.join()
+    finally:
+        if manager:
+            manager.shutdown()
+        listener.stop()
+    # merge results back into requests order
+    results = [None] * len(requests)
+    for index, shard_result in enumerate(shard_results):
+        results[index::shards_count] = shard_result
+    return results
+
+
+def init_worker_log(log_queue: multiprocessing.Queue, log_name: str) -> None:
+    """
+    Worker process initializer: route worker log records to a main process through a queue.
+
+    :param log_queue: queue consumed by a main process log listener
+    :param str log_name: main process log object name
+    :type log_queue: multiprocessing.Queue
+    """
+    logger = logging.getLogger(log_name)
+    logger.setLevel(logging.INFO)
+    logger.handlers = [QueueHandler(log_queue)]
+
+
+def collect_shard(log_name: str, shard: list[dict[str, Any]], _config: dict[str, Any],
+                  sink: DeviceSink | None = None) -> list['DeviceDetails | None']:
+    """
+    Worker process entry point: obtain details of devices from a single shard.
 
+    :param str log_name: main process log object name
+    :param shard: list of request details dicts, one per device
+    :param _config: configuration file content dict, adjusted for a single shard
+    :param sink: device details sink, optional
+    :type shard: list[dict[str, Any]]
+    :type: _config: dict[str, Any]
+    :type sink: DeviceSink or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    log = logging.getLogger(log_name)
+    return get_collector(log, _config, sink)(shard)
+
+
+async def collect_devices_async(log: logging.Logger, requests: list[dict[str, Any]], max_workers: int,
+                                limiter: 'RateLimiter | None' = None,
+                                bulkheads: dict[str, dict[str, int]] | None = None,
+                                controller: 'AdaptiveController | None' = None,
+                                observer: DeviceObserver | None = None,
+                                retry: dict[str, Any] | None = None,
+                                sink: DeviceSink | None = None,
+                                parser: 'ParsePool | None' = None) -> list['DeviceDetails | None']:
+    """
+    Obtain details of all provided devices within a single event loop, limiting sessions in flight to
+    ``max_workers``. If bulkheads are configured, each device type is limited separately and reports its
+    throughput. Otherwise, if an adaptive controller is provided, its level limits sessions in flight.
+    Results are returned in the same order as provided requests.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param max_workers: maximum number of sessions in flight
+    :param limiter: connection rate limiter, optional
+    :param bulkheads: bulkhead settings per device type, optional
+    :param controller: adaptive concurrency controller, optional
+    :param observer: device final outcome observer, notified once retries are over, optional
+    :param retry: transient failures retry settings, optional
+    :param sink: device details sink, optional
+    :param parser: raw outputs parse pool, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type max_workers: int
+    :type limiter: RateLimiter or None
+    :type bulkheads: dict[str, dict[str, int]] or None
+    :type controller: AdaptiveController or None
+    :type observer: DeviceObserver or None
+    :type retry: dict[str, Any] or None
+    :type sink: DeviceSink or None
+    :type parser: ParsePool or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    if controller and not bulkheads:
+        return await dispatch_tasks(log, requests, lambda: controller.level, limiter, controller.observe, observer,
+                                    retry, sink, parser)
+    if not bulkheads:
+        return await dispatch_tasks(log, requests, lambda: max_workers, limiter, None, observer, retry, sink,
+                                    parser)
+
+    # pending coroutines are cheap, so only bulkhead concurrency applies to an asyncio engine
+    async def run_bulkhead(device_type: str, positions: list[int]) -> list['DeviceDetails | None']:
+        settings = bulkheads.get(device_type, {'max_workers': max_workers})
+        started = time.monotonic()
+        tally = Counter()
+        family_results = await dispatch_tasks(log, [requests[position] for position in positions],
+                                              lambda: settings['max_workers'], limiter, None, observer, retry,
+                                              sink, parser, tally)
+        log_throughput(log, device_type, tally['obtained'], len(family_results), time.monotonic() - started)
+        return family_results
+
+    families = group_positions(requests)
+    results = [None] * len(requests)
+    families_results = await asyncio.gather(*(run_bulkhead(device_type, positions)
+                                              for device_type, positions in families.items()))
+    for positions, family_results in zip(families.values(), families_results):
+        for position, _details in zip(positions, family_results):
+            results[position] = _details
+    return results
+
+
+async def dispatch_tasks(log: logging.Logger, requests: list[dict[str, Any]], capacity: Callable[[], int],
+                         limiter: 'RateLimiter | None', attempt_observer: DeviceObserver | None,
+                         observer: DeviceObserver | None, retry: dict[str, Any] | None,
+                         sink: DeviceSink | None = None,
+                         parser: 'ParsePool | None' = None,
+                         tally: Counter | None = None) -> list['DeviceDetails | None']:
+    """
+    Asyncio counterpart of ``dispatch_pool``: keep as many sessions in flight as returned by ``capacity``,
+    putting devices failed with transient errors back at the tail of a work queue after a jittered back-off.
+    Outcomes of devices with outputs handed over to a parse pool are settled by event loop callbacks once parsed.
+    Results are returned in the same order as provided requests, unless handed over to a sink.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param capacity: function returning current maximum number of sessions in flight
+    :param limiter: connection rate limiter, optional
+    :param attempt_observer: observer notified of each connection attempt, optional
+    :param observer: device final outcome observer, optional
+    :param retry: transient failures retry settings, optional
+    :param sink: device details sink, optional
+    :param parser: raw outputs parse pool, optional
+    :param tally: counter of ``obtained`` devices, updated once a device final outcome is known, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type capacity: Callable[[], int]
+    :type limiter: RateLimiter or None
+    :type attempt_observer: DeviceObserver or None
+    :type observer: DeviceObserver or None
+    :type retry: dict[str, Any] or None
+    :type sink: DeviceSink or None
+    :type parser: ParsePool or None
+    :type tally: Counter or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    results = [None] * len(requests)
+    attempts = [0] * len(requests)
+    queue = deque(range(len(requests)))
+    delayed = []
+    in_flight = {}
+    parsing = set()
+
+    def settle(position: int, details: 'DeviceDetails | None', failure: str | None, elapsed: float) -> None:
+        if observer:
+            observer(requests[position], elapsed, failure)
+        if tally is not None and details:
+            tally['obtained'] += 1
+        # details handed over to a sink are not retained
+        if sink:
+            sink(requests[position], details)
+        else:
+            results[position] = details
+
+    def settle_parsed(position: int, elapsed: float, parsed: asyncio.Future) -> None:
+        parsing.discard(parsed)
+        details = parsed.result()
+        settle(position, details, None if details else 'error', elapsed)
+
+    while queue or delayed or in_flight:
+        release_retries(queue, delayed)
+        # top up sessions in flight to a current capacity
+        while queue and len(in_flight) < capacity():
+            position = queue.popleft()
+            task = asyncio.create_task(attempt_device_async(log, requests[position], limiter, attempt_observer,
+                                                            parser))
+            in_flight[task] = position
+        # only retries waiting for their back-off left
+        if not in_flight:
+            await asyncio.sleep(retry_timeout(delayed))
+            continue
+        done, _ = await asyncio.wait(in_flight, timeout=retry_timeout(delayed) if delayed else None,
+                                     return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            position = in_flight.pop(task)
+            details, failure, elapsed = task.result()
+            attempts[position] += 1
+            if isinstance(details, asyncio.Future):
+                parsing.add(details)
+                details.add_done_callback(partial(settle_parsed, position, elapsed))
+            elif not schedule_retry(log, requests[position], failure, attempts[position], retry, delayed, position):
+                settle(position, details, failure, elapsed)
+    # wait for outputs still being parsed, their callbacks run before a wait returns
+    if parsing:
+        await asyncio.wait(parsing)
+    return results
+
+
+async def attempt_device_async(log: logging.Logger, _json: dict[str, Any], limiter: 'RateLimiter | None',
+                               observer: DeviceObserver | None,
+                               parser: 'ParsePool | None' = None
+                               ) -> tuple['DeviceDetails | asyncio.Future | None', str | None, float]:
+    """
+    Asyncio counterpart of ``attempt_device``: single attempt to obtain device details, capturing its outcome.
+
+    :param log: log object
+    :param _json: request details dict
+    :param limiter: connection rate limiter, optional
+    :param observer: observer notified of a connection attempt, optional
+    :param parser: raw outputs parse pool, optional
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :type limiter: RateLimiter or None
+    :type observer: DeviceObserver or None
+    :type parser: ParsePool or None
+    :return: device details or their future (optional), failure kind (optional) and processing time
+    :rtype: tuple[DeviceDetails | asyncio.Future | None, str | None, float]
+    """
+    outcome = []
+    details = await get_switch_details_async(log, _json, limiter, combine_observers([observer,
+                                                                                     capture_outcome(outcome)]),
+                                             parser)
+    return details, outcome[1], outcome[0]
 
-def get_switch_details(log: logging.Logger, _json: dict[str, Any]) -> list[Any] | None:
+
+def get_switch_details(log: logging.Logger, _json: dict[str, Any], limiter: 'RateLimiter | None' = None,
+                       observer: DeviceObserver | None = None,
+                       parser: 'ParsePool | None' = None) -> 'DeviceDetails | Future | None':
     """
     Main function responsible for obtaining device details via a connection with a device.
+    Connection is delayed only if a provided rate limiter budget is exhausted. Raw outputs are parsed once
+    a connection is closed or, if a parse pool is provided, handed over to it and a future resolving to device details
+    is returned at once.
+    Provided observer is notified of a device processing time and failure kind: ``timeout``, ``auth``, ``reset``
+    (session dropped), ``error`` or ``None`` if details were obtained or outputs handed over to a parse pool.
 
     :param log: log object
     :param _json: request details dict
+    :param limiter: connection rate limiter, optional
+    :param observer: device outcome observer, optional
+    :param parser: raw outputs parse pool, optional
     :type log: logging.Logger
     :type _json: dic[str, str]
-    :return: specific device details list, optional
-    :rtype: list[str] or None
+    :type limiter: RateLimiter or None
+    :type observer: DeviceObserver or None
+    :type parser: ParsePool or None
+    :return: specific device details or their future, optional
+    :rtype: DeviceDetails or Future or None
     :raise Exception: ``exc`` version data retrieval from device failed, check command execution chain
     :raise Exception: ``exd`` interfaces data retrieval from device failed, check command execution chain
     :raise Exception: ``exe`` unspecified netmiko exception: please debug communication chain
-    :raise Exception: ``exf`` unspecified ports info parsing exception: please debug script results for a device
     """
-    serial_number = None
-    interfaces = None
-    ports = []
+    cached = None
+    version_info = None
+    output = None
+    failure = 'error'
+    log.info(f"-------------------")
+    log.info(f"DEVICE IP: {_json['host']}")
+    # wait for a connection budget, if exhausted
+    if limiter:
+        limiter.acquire(_json['device_type'])
+    started = time.monotonic()
     # attempt to obtain data
     # anticipate general netmiko connection exceptions
     try:
-        with ConnectHandler(**_json) as net_connect:
-            # firstly attempt to obtain device serial number and model
+        with open_connection(_json) as net_connect:
+            # in a batched mode, commands are sent at once and their output is split by a device prompt
+            # fall back to sending commands one by one if batched output cannot be obtained
+            # in a ports-only mode, version of a recently checked device is taken from a cache
+            cached = get_cached_version(log, _json)
+            commands = ["show interfaces status"] if cached else ["show version", "show interfaces status"]
+            outputs = {}
+            if _json.get('batch_commands'):
+                try:
+                    outputs = send_batched_commands(net_connect, _json['device_type'], commands)
+                except Exception as exb:
+                    log.warning(f"> {_json['host']}: cannot obtain batched commands output: {str(exb)}")
+            # firstly attempt to obtain device version output, holding serial number and model
             try:
-                version_info = net_connect.send_command("show version")
-                serial_number = get_version_detail(log, version_info, 'serial')
-                device_model = get_version_detail(log, version_info, 'model')
+                if not cached:
+                    version_info = outputs.get("show version") or net_connect.send_command("show version")
             except Exception as exc:
-                log.warning(f"> cannot obtain serial number: {str(exc)}")
+                log.warning(f"> {_json['host']}: cannot obtain serial number: {str(exc)}")
             # secondly, attempt to obtain network interfaces response
             # these records will be parsed to provide port details
             try:
-                interfaces = net_connect.send_command("show interfaces status", use_textfsm=True)
-                #print(interfaces)
+                output = outputs.get("show interfaces status") or net_connect.send_command("show interfaces status")
             except Exception as exd:
-                log.warning(f"> cannot obtain interfaces output: {str(exd)}")
-
-        # finally, if obtained interfaces info, parse those to get basic port status data
-        # append device serial number and model info as well
-        if interfaces:
-            for interface in interfaces:
-                port_name = interface['port']
-                port_status = interface['status']
-                ports.append([port_name, port_status])
+                log.warning(f"> {_json['host']}: cannot obtain interfaces output: {str(exd)}")
+                if isinstance(exd, TRANSIENT_ERRORS):
+                    failure = 'reset'
 
     # manage possible exceptions
     except NetMikoTimeoutException:
-        log.warning(f"> connection timed out")
+        log.warning(f"> {_json['host']}: connection timed out")
+        notify_observer(observer, _json, started, 'timeout')
         return None
     except NetMikoAuthenticationException:
-        log.warning(f"> authentication failed, please re-check credentials")
+        log.warning(f"> {_json['host']}: authentication failed, please re-check credentials")
+        notify_observer(observer, _json, started, 'auth')
+        return None
+    except TRANSIENT_ERRORS as exr:
+        log.warning(f"> {_json['host']}: connection dropped: {str(exr)}")
+        notify_observer(observer, _json, started, 'reset')
         return None
     except Exception as exe:
-        log.warning(f"> unspecified exception: {str(exe)}")
+        log.warning(f"> {_json['host']}: unspecified exception: {str(exe)}")
+        notify_observer(observer, _json, started, 'error')
         return None
 
-    # return results if operations successful
-    if not ports:
-        log.warning("no ports info obtained")
-        return None
-    try:
-        results = [[_json['host'], serial_number, device_model, port[0], port[1]] for port in ports]
-        log.info("device details obtained")
-        time.sleep(5)
+    # hand outputs over to a parse pool, a device with no interfaces output has no details to parse
+    if parser and output is not None:
+        results = parser.submit(log, _json, cached, version_info, output)
+        notify_observer(observer, _json, started, None)
         return results
-    except Exception as exf:
-        log.warning(f"exception while formatting device port data: {str(exf)}")
-        return None
+    # return results if operations successful
+    results = parse_device_outputs(log, _json, cached, version_info, output)
+    notify_observer(observer, _json, started, None if results else failure)
+    return results
 
 
-def get_version_detail(log: logging.Logger, version_info: str, detail: str) -> str:
+async def get_switch_details_async(log: logging.Logger, _json: dict[str, Any], limiter: 'RateLimiter | None' = None,
+                                   observer: DeviceObserver | None = None,
+                                   parser: 'ParsePool | None' = None) -> 'DeviceDetails | asyncio.Future | None':
     """
-    Utility function to parse device detail from obtained version info object.
+    Asyncio counterpart of ``get_switch_details``, obtaining device details over an ``asyncssh`` connection.
+    Commands are sent over a single interactive shell, each output read until a device prompt follows it, as devices
+    commonly allow a single exec channel per connection. Interfaces output is parsed with the same TextFSM templates
+    as used by netmiko. Version cache lookups and local parsing run in a worker thread, not to block an event loop.
 
     :param log: log object
-    :param str version_info: device version info object
-    :param str detail: version detail indicator: serial or model
-    :type log: logging.getLogger()
-    :return: requested parameter string
-    :rtype: str
-    :raise Exception: ``exc`` string parsing issue, check parsed output and parsed function to validate proper
-            data extraction from versions output content
+    :param _json: request details dict
+    :param limiter: connection rate limiter, optional
+    :param observer: device outcome observer, optional
+    :param parser: raw outputs parse pool, optional
+    :type log: logging.Logger
+    :type _json: dic[str, str]
+    :type limiter: RateLimiter or None
+    :type observer: DeviceObserver or None
+    :type parser: ParsePool or None
+    :return: specific device details or their future, optional
+    :rtype: DeviceDetails or asyncio.Future or None
+    :raise Exception: ``exc`` version data retrieval from device failed, check command execution chain
+    :raise Exception: ``exd`` interfaces data retrieval from device failed, check command execution chain
+    :raise Exception: ``exe`` unspecified asyncssh exception: please debug communication chain
     """
-    info = None
+    cached = None
+    version_info = None
+    output = None
+    failure = 'error'
+    log.info(f"-------------------")
+    log.info(f"DEVICE IP: {_json['host']}")
+    # wait for a connection budget, if exhausted
+    if limiter:
+        await limiter.acquire_async(_json['device_type'])
+    started = time.monotonic()
+    # attempt to obtain data
+    # anticipate general asyncssh connection exceptions
     try:
-        # attempt to obtain serial number from a specific text record
-        if detail == 'serial':
-            for line in version_info.splitlines():
-                if "System Serial Number" in line or "System serial" in line:  # changed "System serial number"
-                    info = line.split()[-1]
-        # attempt to obtain device model info from a specific text record
-        if detail == 'model':
-            for line in version_info.splitlines():
-                if "cisco" in line.lower() and ("processor" in line.lower() or "chassis" in line.lower()):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        info = parts[1]
-    # anticipate any exception
-    except Exception as exc:
-        log.warning(f"Unspecified exception while attempting to obtain {detail} from device version info: {str(exc)}")
-        return 'No data'
-    # handle missing data
-    # parsing may need to be adjusted to reflect searching pattern more closely
-    if not info:
-        log.warning(f"> no {detail} info found within obtained version info: {str(version_info)}. Validate parsing in"
-                    f"[get_version_detail] function if adjusted incorrectly")
-        return 'No data'
-    else:
-        log.info(f"> device {detail}: {info}")
-        return info
-
+        async with asyncssh.connect(_json['host'], port=_json.get('port', 22), username=_json['username'],
+                                    password=_json['password'], known_hosts=None,
+                                    connect_timeout=ASYNC_CONNECT_TIMEOUT) as connection, \
+                await connection.create_process(term_type='vt100', term_size=(511, 24)) as shell:
+            prompt = await open_shell(shell, _json['device_type'])
+            # firstly attempt to obtain device version output, holding serial number and model
+            # in a ports-only mode, version of a recently checked device is taken from a cache
+            try:
+                cached = await asyncio.to_thread(get_cached_version, log, _json)
+                if not cached:
+                    version_info = await send_shell_command(shell, "show version", prompt)
+            except Exception as exc:
+                log.warning(f"> {_json['host']}: cannot obtain serial number: {str(exc)}")
+            # secondly, attempt to obtain network interfaces response
+            try:
+                output = await send_shell_command(shell, "show interfaces status", prompt)
+            except Exception as exd:
+                log.warning(f"> {_json['host']}: cannot obtain interfaces output: {str(exd)}")
+                if isinstance(exd, (EOFError, OSError, asyncio.TimeoutError, asyncssh.Error)):
+                    failure = 'reset'
 
-# ---------------------------------
+    # manage possible exceptions
+    except (asyncio.TimeoutError, OSError):
+        log.warning(f"> {_json['host']}: connection timed out")
+        notify_observer(observer, _json, started, 'timeout')
+        return None
+    except asyncssh.PermissionDenied:
+        log.warning(f"> {_json['host']}: authentication failed, please re-check credentials")
+        notify_observer(observer, _json, started, 'auth')
+        return None
+    except asyncssh.DisconnectError as exr:
+        log.warning(f"> {_json['host']}: connection dropped: {str(exr)}")
+        notify_observer(observer, _json, started, 'reset')
+        return None
+    except Exception as exe:
+        log.warning(f"> {_json['host']}: unspecified exception: {str(exe)}")
+        notify_observer(observer, _json, started, 'error')
+        return None
+
+    # hand outputs over to a parse pool, a device with no interfaces output has no details to parse
+    if parser and output is not None:
+        results = await parser.submit_async(log, _json, cached, version_info, output)
+        notify_observer(observer, _json, started, None)
+        return results
+    # return results if operations successful
+    results = await asyncio.to_thread(parse_device_outputs, log, _json, cached, version_info, output)
+    notify_observer(observer, _json, started, None if results else failure)
+    return results
+
+
+async def open_shell(shell: Any, device_type: str) -> str:
+    """
+    Prepare an interactive shell session: detect a device prompt and disable paging.
+
+    :param shell: asyncssh interactive shell process
+    :param str device_type: netmiko device type
+    :type shell: asyncssh.SSHClientProcess
+    :return: device prompt
+    :rtype: str
+    """
+    # a device prints its prompt once a shell opens, each command sent later is followed by a single prompt
+    prompt = (await read_until_prompt(shell)).rpartition("\n")[2].strip()
+    await send_shell_command(shell, PAGING_COMMANDS.get(device_type, 'terminal length 0'), prompt)
+    return prompt
+
+
+async def send_shell_command(shell: Any, command: str, prompt: str) -> str:
+    """
+    Send a command over an interactive shell and read its output until a device prompt follows its echo.
+
+    :param shell: asyncssh interactive shell process
+    :param str command: command to send
+    :param str prompt: device prompt
+    :type shell: asyncssh.SSHClientProcess
+    :return: command output, without an echoed command line and a closing prompt
+    :rtype: str
+    """
+    shell.stdin.write(f"{command}\n")
+    output = await read_until_prompt(shell, prompt, command)
+    return output.partition(command)[2].partition("\n")[2].rpartition("\n")[0]
+
+
+async def read_until_prompt(shell: Any, prompt: str | None = None, echo: str = "") -> str:
+    """
+    Read interactive shell output until a provided device prompt (or, if not provided, any line looking like
+    a device prompt) closes it. If an echoed command is provided, only a prompt following it counts, so prompts
+    left over from earlier commands are skipped.
+
+    :param shell: asyncssh interactive shell process
+    :param prompt: device prompt, optional
+    :param str echo: echoed command, optional
+    :type shell: asyncssh.SSHClientProcess
+    :type prompt: str or None
+    :return: output read, with carriage returns removed
+    :rtype: str
+    :raise EOFError: session closed before a prompt was read
+    :raise asyncio.TimeoutError: no prompt read within a read timeout
+    """
+    output = ""
+    while True:
+        chunk = await asyncio.wait_for(shell.stdout.read(65536), ASYNC_READ_TIMEOUT)
+        if not chunk:
+            raise EOFError("session closed before a device prompt was read")
+        output += chunk.replace("\r", "")
+        if echo not in output:
+            continue
+        last_line = (output.partition(echo)[2] if echo else output).rpartition("\n")[2].strip()
+        if (last_line == prompt) if prompt else PROMPT_PATTERN.fullmatch(last_line):
+            return output
+
+
+def open_connection(_json: dict[str, Any]) -> Any:
+    """
+    Open netmiko connection with a device. With a ``minimal_session`` request option, full session preparation
+    is skipped: only a prompt is detected and, unless commands are batched, paging is disabled.
+
+    :param _json: request details dict
+    :type _json: dict[str, Any]
+    :return: netmiko connection object
+    :rtype: netmiko.BaseConnection
+    """
+    if not _json.get('minimal_session'):
+        return ConnectHandler(**get_connection_details(_json))
+    net_connect = ConnectHandler(**get_connection_details(_json), auto_connect=False)
+    try:
+        net_connect.establish_connection()
+        net_connect.set_base_prompt()
+        # batched commands disable paging themselves
+        if not _json.get('batch_commands'):
+            net_connect.disable_paging()
+    except Exception:
+        net_connect.disconnect()
+        raise
+    return net_connect
+
+
+def send_batched_commands(net_connect: Any, device_type: str, commands: list[str]) -> dict[str, str]:
+    """
+    Send commands in a single channel write, preceded once by a paging disable command, then read until a device
+    prompt follows each of them. Combined output is split by a device prompt into per command outputs.
+
+    :param net_connect: netmiko connection object
+    :param str device_type: netmiko device type
+    :param commands: commands to send
+    :type net_connect: netmiko.BaseConnection
+    :type commands: list[str]
+    :return: output per command
+    :rtype: dict[str, str]
+    """
+    prompt = net_connect.find_prompt()
+    commands = [PAGING_COMMANDS.get(device_type, 'terminal length 0')] + commands
+    net_connect.write_channel("".join(net_connect.normalize_cmd(command) for command in commands))
+    # prompt is printed once after each command, each command echo follows a prompt
+    output = net_connect.read_until_pattern(pattern=rf"(?:.*?{re.escape(prompt)}){{{len(commands)}}}",
+                                            re_flags=re.DOTALL, read_timeout=BATCH_READ_TIMEOUT)
+    segments = output.replace("\r", "").split(prompt)
+    # drop paging command output and echoed command lines
+    return {command: segment.partition("\n")[2] for command, segment in zip(commands[1:], segments[1:])}
+
+
+def notify_observer(observer: DeviceObserver | None, _json: dict[str, Any], started: float,
+                    failure: str | None) -> None:
+    """
+    Notify device outcome observer, if provided, of a device processing time and failure kind.
+
+    :param observer: device outcome observer, optional
+    :param _json: request details dict
+    :param float started: device processing start, as ``time.monotonic()`` value
+    :param failure: failure kind: ``timeout``, ``auth``, ``reset``, ``error`` or ``None`` if details were obtained
+    :type observer: DeviceObserver or None
+    :type _json: dict[str, Any]
+    :type failure: str or None
+    """
+    if observer:
+        observer(_json, time.monotonic() - started, failure)
+
+
+def combine_observers(observers: list[DeviceObserver | None]) -> DeviceObserver | None:
+    """
+    Combine provided device outcome observers into a single observer, skipping missing ones.
+
+    :param observers: device outcome observers, optional
+    :type observers: list[DeviceObserver | None]
+    :return: combined observer, ``None`` if no observer is provided
+    :rtype: DeviceObserver or None
+    """
+    observers = [observer for observer in observers if observer]
+    if len(observers) < 2:
+        return observers[0] if observers else None
+
+    def observer(_json: dict[str, Any], elapsed: float, failure: str | None) -> None:
+        for single in observers:
+            single(_json, elapsed, failure)
+
+    return observer
+
+
+def combine_sinks(log: logging.Logger, sinks: list[DeviceSink | None]) -> DeviceSink | None:
+    """
+    Combine provided device details sinks into a single sink, skipping missing ones.
+    A failing sink is logged and does not stop the other sinks, nor a collection.
+
+    :param log: log object
+    :param sinks: device details sinks, optional
+    :type log: logging.Logger
+    :type sinks: list[DeviceSink | None]
+    :return: combined sink, ``None`` if no sink is provided
+    :rtype: DeviceSink or None
+    :raise Exception: ``exc`` sink failure (export, checkpoint or store write issue), device is skipped by a sink
+    """
+    sinks = [sink for sink in sinks if sink]
+    if not sinks:
+        return None
+
+    def sink(_json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        for single in sinks:
+            try:
+                single(_json, details)
+            except Exception as exc:
+                log.warning(f"> {_json['host']}: cannot hand over device details: {str(exc)}")
+
+    return sink
+
+
+def put_device(sink_queue: Any, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+    """
+    Worker process device details sink: hand details over to a main process through a queue.
+
+    :param sink_queue: queue consumed by a main process sink
+    :param _json: request details dict
+    :param details: device details, optional
+    :type sink_queue: multiprocessing.Queue
+    :type _json: dict[str, Any]
+    :type details: DeviceDetails or None
+    """
+    sink_queue.put((_json, details))
+
+
+def drain_devices(log: logging.Logger, sink_queue: Any, sink: DeviceSink) -> None:
+    """
+    Pass device details received from worker processes to a main process sink, until ``None`` is received.
+    A sink failure is logged, so the drainer keeps passing details of later devices.
+
+    :param log: log object
+    :param sink_queue: queue filled by worker processes
+    :param sink: device details sink
+    :type log: logging.Logger
+    :type sink_queue: multiprocessing.Queue
+    :type sink: DeviceSink
+    :raise Exception: ``exc`` sink failure, device is skipped by a sink
+    """
+    for _json, details in iter(sink_queue.get, None):
+        try:
+            sink(_json, details)
+        except Exception as exc:
+            log.warning(f"> {_json['host']}: cannot hand over device details: {str(exc)}")
+
+
+class OrderedSink:
+    """
+    Reorder buffer in front of a device details sink: devices of each device type are handed over in the order they
+    were requested, as soon as all earlier devices of the same type have arrived. A device processed ahead of its turn
+    waits in a buffer, so only devices overtaken by a slower one are held in memory, not all devices of a run.
+    Devices which are not expected are handed over immediately. Safe to use from multiple threads.
+    """
+
+    def __init__(self, sink: DeviceSink) -> None:
+        self.sink = sink
+        self.expected = {}
+        self.waiting = Counter()
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def expect(self, requests: list[dict[str, Any]]) -> None:
+        """
+        Register devices about to be processed, in their request order.
+
+        :param requests: list of request details dicts, one per device
+        :type requests: list[dict[str, Any]]
+        """
+        with self.lock:
+            for _json in requests:
+                self.expected.setdefault(_json['device_type'], deque()).append(_json)
+                self.waiting[(_json['device_type'], _json['host'])] += 1
+
+    def record(self, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        """
+        Device details sink: hand details of a device over, together with any later devices waiting for it,
+        or keep them until all earlier devices of the same type arrive.
+
+        :param _json: request details dict
+        :param details: device details, optional
+        :type _json: dict[str, Any]
+        :type details: DeviceDetails or None
+        """
+        key = (_json['device_type'], _json['host'])
+        with self.lock:
+            if self.waiting[key]:
+                self.pending.setdefault(key, deque()).append((_json, details))
+                # devices are handed over under a lock, so concurrent releases cannot overtake each other
+                for ready_json, ready_details in self.release(_json['device_type']):
+                    self.sink(ready_json, ready_details)
+                return
+        self.sink(_json, details)
+
+    def release(self, device_type: str) -> list[tuple[dict[str, Any], 'DeviceDetails | None']]:
+        """
+        Take devices of a device type whose turn has come off a buffer. Must be called with a lock held.
+
+        :param str device_type: netmiko device type
+        :return: request details dict and device details of each released device, in request order
+        :rtype: list[tuple[dict[str, Any], DeviceDetails | None]]
+        """
+        expected = self.expected.get(device_type)
+        released = []
+        while expected and self.pending.get((device_type, expected[0]['host'])):
+            key = (device_type, expected.popleft()['host'])
+            released.append(self.pending[key].popleft())
+            if not self.pending[key]:
+                del self.pending[key]
+            self.waiting[key] -= 1
+        return released
+
+    def flush(self) -> None:
+        """
+        Hand over all buffered devices in request order, skipping expected devices which never arrived,
+        and forget the expected ones.
+        """
+        with self.lock:
+            for device_type, expected in self.expected.items():
+                for _json in expected:
+                    key = (device_type, _json['host'])
+                    if self.pending.get(key):
+                        self.sink(*self.pending[key].popleft())
+            self.expected.clear()
+            self.waiting.clear()
+            self.pending.clear()
+
+
+class DeviceDetails:
+    """
+    Compact device details: device serial number and model are kept once per device, ports as a table of port names
+    and statuses, both interned, so repeated names and statuses are shared by all devices in memory.
+    Iterating yields report rows: IP, SN, Model, Port, PortStatus.
+    """
+    __slots__ = ('host', 'serial_number', 'model', 'ports', 'statuses')
+
+    def __init__(self, host: str, serial_number: str | None, model: str | None, ports: list[str],
+                 statuses: list[str]) -> None:
+        self.host = host
+        self.serial_number = serial_number
+        self.model = model
+        self.ports = tuple(sys.intern(port) for port in ports)
+        self.statuses = tuple(sys.intern(status) for status in statuses)
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        for port, status in zip(self.ports, self.statuses):
+            yield [self.host, self.serial_number, self.model, port, status]
+
+    def to_list(self) -> list[Any]:
+        """
+        Return details as a JSON serializable list.
+
+        :return: host, serial number, model, port names and port statuses
+        :rtype: list[Any]
+        """
+        return [self.host, self.serial_number, self.model, list(self.ports), list(self.statuses)]
+
+    @classmethod
+    def from_list(cls, values: list[Any]) -> 'DeviceDetails':
+        """
+        Create details from a list returned by ``to_list``.
+
+        :param values: host, serial number, model, port names and port statuses
+        :type values: list[Any]
+        :return: device details
+        :rtype: DeviceDetails
+        """
+        return cls(*values)
+
+
+def parse_device_outputs(log: logging.Logger, _json: dict[str, Any], cached: tuple[str, str] | None,
+                         version_info: str | None, output: str | None) -> 'DeviceDetails | None':
+    """
+    Parse raw device outputs into device details: serial number and model from ``show version`` output (unless
+    cached) and ports from ``show interfaces status`` output. Missing outputs leave their details empty.
+    If a capture is enabled, raw outputs are stored before parsing.
+
+    :param log: log object
+    :param _json: request details dict
+    :param cached: cached serial number and model, optional
+    :param version_info: raw show version output, optional
+    :param output: raw show interfaces status output, optional
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :type cached: tuple[str, str] or None
+    :type version_info: str or None
+    :type output: str or None
+    :return: specific device details, optional
+    :rtype: DeviceDetails or None
+    :raise Exception: ``exc`` version output parsing failed, check parsed output and version parser
+    :raise Exception: ``exd`` interfaces output parsing failed, check parsed output and TextFSM template
+    """
+    if _json.get('capture'):
+        store_captures(log, _json, {"show version": version_info, "show interfaces status": output})
+    serial_number, device_model = cached or (None, None)
+    interfaces = None
+    if version_info is not None:
+        try:
+            serial_number, device_model = parse_version(log, _json, version_info)
+        except Exception as exc:
+            log.warning(f"> {_json['host']}: cannot parse serial number: {str(exc)}")
+    # raw output is parsed with a TextFSM template compiled once per process
+    if output is not None:
+        try:
+            interfaces = parse_structured_data(log, output, _json['device_type'], "show interfaces status")
+        except Exception as exd:
+            log.warning(f"> {_json['host']}: cannot parse interfaces output: {str(exd)}")
+    return format_device_details(log, _json['host'], serial_number, device_model, interfaces)
+
+
+def format_device_details(log: logging.Logger, host: str, serial_number: str | None, device_model: str | None,
+                          interfaces: list[dict[str, str]] | None) -> 'DeviceDetails | None':
+    """
+    Parse obtained interfaces info to get basic port status data, together with device serial number and model info.
+
+    :param log: log object
+    :param host: device IP address
+    :param serial_number: device serial number, optional
+    :param device_model: device model, optional
+    :param interfaces: parsed interfaces output, optional
+    :type log: logging.Logger
+    :type host: str
+    :type serial_number: str or None
+    :type device_model: str or None
+    :type interfaces: list[dict[str, str]] or None
+    :return: specific device details, optional
+    :rtype: DeviceDetails or None
+    :raise Exception: ``exf`` unspecified ports info parsing exception: please debug script results for a device
+    """
+    try:
+        ports = [[interface['port'], interface['status']] for interface in interfaces or []]
+        if not ports:
+            log.warning(f"> {host}: no ports info obtained")
+            return None
+        results = DeviceDetails(host, serial_number, device_model, [port[0] for port in ports],
+                                [port[1] for port in ports])
+        log.info(f"> {host}: device details obtained")
+        return results
+    except Exception as exf:
+        log.warning(f"> {host}: exception while formatting device port data: {str(exf)}")
+        return None
+
+
+def register_version_parser(*device_types: str, details: tuple[str, ...] = VERSION_DETAILS) -> Callable:
+    """
+    Decorator registering a show version parser for provided device types.
+    A parser takes raw show version output and returns found details, keyed by names from ``VERSION_DETAILS``.
+    Only missing serial number or model listed in ``details`` are reported, others are not part of a device output.
+
+    :param device_types: netmiko device types handled by a parser
+    :param details: details present in show version output of these device types
+    :type device_types: str
+    :type details: tuple[str, ...]
+    :return: decorator returning a registered parser unchanged
+    :rtype: Callable
+    """
+    def register(parser: Callable[[str], dict[str, str]]) -> Callable[[str], dict[str, str]]:
+        for device_type in device_types:
+            VERSION_PARSERS[device_type] = parser, details
+        return parser
+    return register
+
+
+@register_version_parser('cisco_ios', 'cisco_xe')
+def parse_cisco_version(version_info: str) -> dict[str, str]:
+    """
+    Cisco IOS show version parser: serial number and model, found in a single pass over output lines.
+    If a detail is found in several lines (e.g. a switch stack), the last one is used.
+
+    :param str version_info: device version info object
+    :return: found version details dict
+    :rtype: dict[str, str]
+    """
+    info = {}
+    for line in version_info.splitlines():
+        # serial number from a specific text record
+        if "System Serial Number" in line or "System serial" in line:  # changed "System serial number"
+            info['serial'] = line.split()[-1]
+        # device model from a specific text record
+        lowered = line.lower()
+        if "cisco" in lowered and ("processor" in lowered or "chassis" in lowered):
+            parts = line.split()
+            if len(parts) >= 2:
+                info['model'] = parts[1]
+    return info
+
+
+@register_version_parser('aruba_os', details=('model', 'version', 'uptime'))
+def parse_arubaos_version(version_info: str) -> dict[str, str]:
+    """
+    ArubaOS show version parser, single pass over output lines with precompiled patterns applied only to lines holding
+    their keyword. The first occurrence of a detail is used. Serial number is not part of ArubaOS show version output.
+
+    :param str version_info: device version info object
+    :return: found version details dict
+    :rtype: dict[str, str]
+    """
+    info = {}
+    for line in version_info.splitlines():
+        if "MODEL:" in line:
+            details = ('model', 'version')
+        elif "uptime is" in line:
+            details = ('uptime',)
+        else:
+            continue
+        for detail in details:
+            match = ARUBAOS_VERSION_PATTERNS[detail].search(line)
+            if match:
+                info.setdefault(detail, match.group(1))
+    return info
+
+
+@register_version_parser('aruba_osswitch', 'hp_procurve', details=('version',))
+def parse_aruba_switch_version(version_info: str) -> dict[str, str]:
+    """
+    ArubaOS-Switch (ProCurve) show version parser: software version from an image stamp line, e.g. ``KB.16.08.0001``.
+    Serial number and model are not part of ArubaOS-Switch show version output.
+
+    :param str version_info: device version info object
+    :return: found version details dict
+    :rtype: dict[str, str]
+    """
+    for line in version_info.splitlines():
+        match = ARUBA_SWITCH_IMAGE_PATTERN.match(line)
+        if match:
+            return {'version': match.group(1)}
+    return {}
+
+
+def get_version_details(log: logging.Logger, host: str, version_info: str,
+                        device_type: str = DEFAULT_VERSION_PARSER) -> dict[str, str]:
+    """
+    Utility function to parse device details from obtained version info object: serial number, model and, on
+    platforms without a serial number in their output, software version and uptime. A parser registered for a device
+    type is looked up once, device types without a registered parser are parsed as ``DEFAULT_VERSION_PARSER``.
+    Missing serial number or model is reported only if a device type show version output holds it.
+
+    :param log: log object
+    :param str host: device IP address
+    :param str version_info: device version info object
+    :param str device_type: netmiko device type, selecting a parser
+    :type log: logging.getLogger()
+    :return: version details dict, ``No data`` for details not found
+    :rtype: dict[str, str]
+    :raise Exception: ``exc`` string parsing issue, check parsed output and parsed function to validate proper
+            data extraction from versions output content
+    """
+    info = {}
+    parser, reported = VERSION_PARSERS.get(device_type) or VERSION_PARSERS[DEFAULT_VERSION_PARSER]
+    try:
+        info = parser(version_info)
+    # anticipate any exception
+    except Exception as exc:
+        log.warning(f"> {host}: unspecified exception while attempting to obtain details from device version info:"
+                    f" {str(exc)}")
+    # handle missing data
+    # parsing may need to be adjusted to reflect searching pattern more closely
+    for detail in VERSION_DETAILS:
+        if info.get(detail):
+            log.info(f"> {host}: device {detail}: {info[detail]}")
+        else:
+            # only serial number and model present in a device output are reported, other details are informative
+            if detail in ('serial', 'model') and detail in reported:
+                log.warning(f"> {host}: no {detail} info found within obtained version info: {str(version_info)}."
+                            f" Validate parsing in [{parser.__name__}] function if adjusted incorrectly")
+            info[detail] = 'No data'
+    return info
+
+
+# ---------------------------------
+# pre-flight reachability sweep
+# ---------------------------------
+def get_preflight_settings(log: logging.Logger, _config: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Read pre-flight reachability sweep settings from a config file content, completed with default values.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: pre-flight settings dict, ``None`` if sweep is not enabled
+    :rtype: dict[str, Any] or None
+    """
+    settings = {**DEFAULT_PREFLIGHT, **(_config.get('preflight') or {})}
+    if not settings['enabled']:
+        return None
+    if settings['action'] not in ('drop', 'defer') or not isinstance(settings['concurrency'], int) \
+            or settings['concurrency'] < 1:
+        log.warning(f"incorrect [preflight] value: {settings}, reachability sweep will be skipped")
+        return None
+    log.info(f"devices will be probed on tcp/{settings['port']} before login, unreachable ones will be"
+             f" {'deferred' if settings['action'] == 'defer' else 'dropped'}")
+    return settings
+
+
+async def probe_hosts(hosts: list[str], port: int, timeout: float, concurrency: int) -> list[bool]:
+    """
+    Probe TCP port of provided hosts concurrently, with a short connection timeout.
+
+    :param hosts: device IP addresses
+    :param int port: probed TCP port
+    :param float timeout: connection timeout, in seconds
+    :param int concurrency: maximum number of probes in flight, keeping open sockets count bounded
+    :type hosts: list[str]
+    :return: reachability flag per host, in the same order as provided hosts
+    :rtype: list[bool]
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> bool:
+        async with semaphore:
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            except Exception:
+                return False
+            writer.close()
+            return True
+
+    return list(await asyncio.gather(*(probe(host) for host in hosts)))
+
+
+def sweep_requests(log: logging.Logger, requests: list[dict[str, Any]],
+                   settings: dict[str, Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split provided requests into reachable and unreachable devices with a concurrent TCP probe.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param settings: pre-flight settings dict
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type settings: dict[str, Any]
+    :return: reachable and unreachable devices requests, keeping provided order
+    :rtype: tuple[list[dict[str, Any]], list[dict[str, Any]]]
+    """
+    started = time.monotonic()
+    flags = asyncio.run(probe_hosts([_json['host'] for _json in requests], settings['port'], settings['timeout'],
+                                    settings['concurrency']))
+    reachable = [_json for _json, flag in zip(requests, flags) if flag]
+    unreachable = [_json for _json, flag in zip(requests, flags) if not flag]
+    log.info(f"reachability sweep: {len(reachable)}/{len(requests)} device(s) reachable on tcp/{settings['port']}"
+             f" ({time.monotonic() - started:.1f}s)")
+    for _json in unreachable:
+        log.warning(f"> {_json['host']}: unreachable on tcp/{settings['port']}")
+    return reachable, unreachable
+
+
+# ---------------------------------
+# distributed work queue
+# ---------------------------------
+QUEUE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    run_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    device_type TEXT NOT NULL,
+    host TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed_at REAL,
+    result TEXT,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, claimed_at);
+"""
+
+
+def get_queue_settings(_config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Read distributed work queue settings from a config file content, completed with default values.
+    Relative queue path is resolved against a script directory.
+
+    :param _config: configuration file content dict
+    :type: _config: dict[str, Any]
+    :return: queue settings dict
+    :rtype: dict[str, Any]
+    """
+    settings = {**DEFAULT_QUEUE, **(_config.get('queue') or {})}
+    if settings['path']:
+        settings['path'] = str(Path(__file__).parent / settings['path'])
+    return settings
+
+
+def open_queue(queue_path: str) -> sqlite3.Connection:
+    """
+    Open a shared SQLite work queue, creating its structure if not present.
+    Connection runs in autocommit mode, transactions are opened explicitly where jobs are claimed or written.
+
+    :param str queue_path: queue database file path
+    :return: queue database connection
+    :rtype: sqlite3.Connection
+    """
+    connection = sqlite3.connect(queue_path, timeout=60, isolation_level=None)
+    connection.executescript(QUEUE_SCHEMA)
+    return connection
+
+
+def write_queue(connection: sqlite3.Connection, statement: str, rows: list[tuple[Any, ...]]) -> None:
+    """
+    Execute a queue write statement for all provided rows within a single explicit transaction, so a queue file
+    (possibly on a network share) is locked and synced once per call instead of once per row.
+
+    :param connection: queue database connection
+    :param str statement: SQL statement with parameters
+    :param rows: statement parameters, one tuple per row
+    :type connection: sqlite3.Connection
+    :type rows: list[tuple[Any, ...]]
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.executemany(statement, rows)
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def claim_queue_jobs(connection: sqlite3.Connection, worker: str, batch: int, lease: float,
+                     run_id: str | None = None) -> list[tuple[str, int, str, str]]:
+    """
+    Atomically claim a batch of pending jobs, or jobs whose claim lease expired (e.g. a worker node died).
+
+    :param connection: queue database connection
+    :param str worker: claiming worker name
+    :param int batch: maximum number of claimed jobs
+    :param float lease: seconds after which a claimed, unfinished job may be claimed again
+    :param run_id: claim jobs of a single run only, optional
+    :type connection: sqlite3.Connection
+    :type run_id: str or None
+    :return: claimed jobs: run id, position, device type and host
+    :rtype: list[tuple[str, int, str, str]]
+    """
+    now = time.time()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        jobs = connection.execute("SELECT run_id, position, device_type, host FROM jobs "
+                                  "WHERE (status = 'pending' OR (status = 'claimed' AND claimed_at < ?)) "
+                                  "AND (? IS NULL OR run_id = ?) ORDER BY run_id, position LIMIT ?",
+                                  (now - lease, run_id, run_id, batch)).fetchall()
+        connection.executemany("UPDATE jobs SET status = 'claimed', worker = ?, claimed_at = ? "
+                               "WHERE run_id = ? AND position = ?",
+                               [(worker, now, job[0], job[1]) for job in jobs])
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    return jobs
+
+
+def process_queue_jobs(log: logging.Logger, connection: sqlite3.Connection, _config: dict[str, Any],
+                       collector: Callable[[list[dict[str, Any]]], list['DeviceDetails | None']],
+                       run_id: str | None = None, idle_timeout: float = 0,
+                       poll: Callable[[], None] | None = None) -> int:
+    """
+    Claim queued device jobs in batches, obtain device details with a provided collector and push rows back.
+    Stop once no job can be claimed for ``idle_timeout`` seconds.
+
+    :param log: log object
+    :param connection: queue database connection
+    :param _config: configuration file content dict
+    :param collector: devices collector function
+    :param run_id: process jobs of a single run only, optional
+    :param float idle_timeout: seconds to wait for new jobs before stopping
+    :param poll: function called after each processed batch, e.g. handing over jobs finished by other workers
+    :type log: logging.Logger
+    :type connection: sqlite3.Connection
+    :type: _config: dict[str, Any]
+    :type collector: Callable[[list[dict[str, Any]]], list[DeviceDetails | None]]
+    :type run_id: str or None
+    :type poll: Callable[[], None] or None
+    :return: number of processed jobs
+    :rtype: int
+    """
+    settings = get_queue_settings(_config)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    # claim enough jobs to keep all local connections busy
+    max_workers = _config.get('max_workers', 1)
+    batch = 4 * (max_workers if isinstance(max_workers, int) and max_workers > 0 else 1)
+    processed = 0
+    idle_since = time.monotonic()
+    while True:
+        jobs = claim_queue_jobs(connection, worker, batch, settings['lease'], run_id)
+        if not jobs:
+            if time.monotonic() - idle_since >= idle_timeout:
+                return processed
+            time.sleep(settings['poll_interval'])
+            continue
+        log.info(f"claimed {len(jobs)} queued device job(s)")
+        requests = [build_request(job[2], job[3], _config) for job in jobs]
+        details = collector(requests)
+        write_queue(connection, "UPDATE jobs SET status = 'done', result = ? "
+                                "WHERE run_id = ? AND position = ? AND worker = ?",
+                    [(json.dumps(_details.to_list()) if _details else None, job[0], job[1], worker)
+                     for job, _details in zip(jobs, details)])
+        processed += len(jobs)
+        idle_since = time.monotonic()
+        if poll:
+            poll()
+
+
+def collect_devices_distributed(log: logging.Logger, requests: list[dict[str, Any]], _config: dict[str, Any],
+                                collector: Callable[[list[dict[str, Any]]], list['DeviceDetails | None']],
+                                sink: DeviceSink | None = None) -> list['DeviceDetails | None']:
+    """
+    Coordinator side of a distributed collection: enqueue device jobs into a shared queue, process jobs locally
+    alongside worker script instances, then wait for all jobs and return their results.
+    Results are returned in the same order as provided requests, unless handed over to a sink: devices processed
+    locally reach a sink through a collector, devices processed by worker instances as soon as a coordinator finds
+    their jobs finished, after each local batch and while waiting for worker instances.
+
+    :param log: log object
+    :param requests: list of request details dicts, one per device
+    :param _config: configuration file content dict
+    :param collector: devices collector function
+    :param sink: device details sink, optional
+    :type log: logging.Logger
+    :type requests: list[dict[str, Any]]
+    :type: _config: dict[str, Any]
+    :type collector: Callable[[list[dict[str, Any]]], list[DeviceDetails | None]]
+    :type sink: DeviceSink or None
+    :return: device details, ``None`` for devices with no data obtained
+    :rtype: list[DeviceDetails | None]
+    """
+    settings = get_queue_settings(_config)
+    run_id = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{socket.gethostname()}_{os.getpid()}"
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    connection = open_queue(settings['path'])
+
+    def hand_over() -> None:
+        # jobs finished by worker instances are handed over to a sink and removed, so each is read once
+        rows = connection.execute("SELECT position, result FROM jobs WHERE run_id = ? AND status = 'done' "
+                                  "AND worker != ?", (run_id, worker)).fetchall()
+        for position, result in rows:
+            sink(requests[position], DeviceDetails.from_list(json.loads(result)) if result else None)
+        if rows:
+            write_queue(connection, "DELETE FROM jobs WHERE run_id = ? AND position = ?",
+                        [(run_id, row[0]) for row in rows])
+
+    poll = hand_over if sink else None
+    try:
+        # credentials are not shared through a queue, each worker uses its own config file
+        write_queue(connection, "INSERT INTO jobs (run_id, position, device_type, host) VALUES (?, ?, ?, ?)",
+                    [(run_id, position, _json['device_type'], _json['host'])
+                     for position, _json in enumerate(requests)])
+        log.info(f"queued {len(requests)} device job(s) for run {run_id} in [{settings['path']}]")
+        processed = process_queue_jobs(log, connection, _config, collector, run_id, poll=poll)
+        log.info(f"processed {processed} device job(s) locally, waiting for worker instances")
+        # wait for remaining jobs, re-claiming these whose worker lease expired
+        while connection.execute("SELECT COUNT(*) FROM jobs WHERE run_id = ? AND status != 'done'",
+                                 (run_id,)).fetchone()[0]:
+            time.sleep(settings['poll_interval'])
+            if poll:
+                poll()
+            process_queue_jobs(log, connection, _config, collector, run_id, poll=poll)
+        # devices processed locally have already reached a sink, these processed by worker instances too
+        results = [None] * len(requests)
+        if poll:
+            poll()
+        else:
+            results = [DeviceDetails.from_list(json.loads(row[0])) if row[0] else None for row in connection.execute(
+                "SELECT result FROM jobs WHERE run_id = ? ORDER BY position", (run_id,))]
+        write_queue(connection, "DELETE FROM jobs WHERE run_id = ?", [(run_id,)])
+    finally:
+        connection.close()
+    return results
+
+
+def execute_queue_worker(log: logging.Logger, _config: dict[str, Any]) -> None:
+    """
+    Worker side of a distributed collection: process device jobs of any coordinator run from a shared queue
+    until no new jobs arrive for a configured idle timeout.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :raise Exception: ``exc`` queue processing exception, check queue file accessibility
+    """
+    get_credentials(log, _config)
+    settings = get_queue_settings(_config)
+    if not settings['path']:
+        log.critical(f"no [queue] path provided in [config.json], worker will now exit.")
+        exit()
+    collector = get_collector(log, _config)
+    try:
+        connection = open_queue(settings['path'])
+        try:
+            log.info(f"worker processing device jobs from [{settings['path']}]")
+            processed = process_queue_jobs(log, connection, _config, collector,
+                                           idle_timeout=settings['idle_timeout'])
+        finally:
+            connection.close()
+    except Exception as exc:
+        log.critical(f"cannot process queued device jobs: {str(exc)}")
+        return
+    log.info(f"no queued device jobs left, {processed} job(s) processed by this worker")
+
+
+# ---------------------------------
+# connection rate limiting
+# ---------------------------------
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens are refilled continuously at a ``rate`` per second, up to ``burst`` tokens.
+    Each connection takes one token; when the bucket is empty, a caller is told how long to wait for its token.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from a bucket, possibly going into debt so that waiting callers are served in order.
+
+        :return: delay in seconds before a reserved token may be used
+        :rtype: float
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Connection rate limiter combining a global token bucket with optional per device type buckets.
+    A connection waits only as long as the most exhausted of applicable budgets requires.
+    """
+
+    def __init__(self, global_bucket: TokenBucket | None, type_buckets: dict[str, TokenBucket]) -> None:
+        self.global_bucket = global_bucket
+        self.type_buckets = type_buckets
+
+    def reserve(self, device_type: str) -> float:
+        """
+        Reserve a connection in all applicable budgets.
+
+        :param str device_type: netmiko device type of a connected device
+        :return: delay in seconds before a connection may be opened
+        :rtype: float
+        """
+        buckets = [self.global_bucket, self.type_buckets.get(device_type)]
+        return max([bucket.reserve() for bucket in buckets if bucket] or [0.0])
+
+    def acquire(self, device_type: str) -> None:
+        """
+        Block calling thread until a connection budget is available.
+
+        :param str device_type: netmiko device type of a connected device
+        """
+        delay = self.reserve(device_type)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, device_type: str) -> None:
+        """
+        Suspend calling coroutine until a connection budget is available.
+
+        :param str device_type: netmiko device type of a connected device
+        """
+        delay = self.reserve(device_type)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def split_config(_config: dict[str, Any], shares: int) -> dict[str, Any]:
+    """
+    Adjust config file content for a single worker process out of ``shares``: connection budgets, bulkheads and
+    adaptive concurrency bounds are split evenly, so their sum across processes keeps configured values.
+
+    :param _config: configuration file content dict
+    :param int shares: number of worker processes
+    :type: _config: dict[str, Any]
+    :return: configuration file content dict for a single worker process
+    :rtype: dict[str, Any]
+    """
+    bulkheads = {}
+    for device_type, settings in (_config.get('bulkheads') or {}).items():
+        if not isinstance(settings, dict):
+            # incorrect settings are reported by a collector created in each worker process
+            bulkheads[device_type] = settings
+            continue
+        bulkheads[device_type] = dict(settings)
+        # each process keeps at least one connection slot per device type
+        for key, minimum in (('max_workers', 1), ('queue_depth', 0)):
+            if isinstance(settings.get(key), int):
+                bulkheads[device_type][key] = max(minimum, settings[key] // shares)
+    adaptive = dict(_config.get('adaptive') or {})
+    for key in ('min_workers', 'max_workers'):
+        if isinstance(adaptive.get(key), int):
+            adaptive[key] = max(1, adaptive[key] // shares)
+    worker_config = {**_config, 'processes': 1, 'parse_pool': None, 'bulkheads': bulkheads, 'adaptive': adaptive}
+    # a default budget follows parallel connections of each process already
+    if 'rate_limit' in _config:
+        worker_config['rate_limit'] = split_rate_limit(_config['rate_limit'], shares)
+    return worker_config
+
+
+def split_rate_limit(rate_limit: dict[str, Any], shares: int) -> dict[str, Any]:
+    """
+    Split connection rate limit settings evenly between worker processes, so their sum keeps configured budgets.
+
+    :param rate_limit: connection rate limit settings, as configured in a config file
+    :param int shares: number of worker processes
+    :type rate_limit: dict[str, Any]
+    :return: connection rate limit settings for a single worker process
+    :rtype: dict[str, Any]
+    """
+    def split(budget: dict[str, Any]) -> dict[str, Any]:
+        burst = int(budget.get('burst', 1))
+        # incorrect bursts are kept as configured, to be reported in each worker process
+        return {'rate': (budget.get('rate') or 0) / shares, 'burst': max(1, burst // shares) if burst >= 1 else burst}
+
+    try:
+        return {**split(rate_limit),
+                'device_types': {device_type: split(budget)
+                                 for device_type, budget in rate_limit.get('device_types', {}).items()}}
+    except Exception:
+        # incorrect settings are reported by a rate limiter created in each worker process
+        return rate_limit
+
+
+def get_rate_limiter(log: logging.Logger, _config: dict[str, Any], connections: int = 1) -> RateLimiter | None:
+    """
+    Create connection rate limiter from a config file content. Budgets with a rate of 0 are not limited, negative
+    rates and bursts below 1 are rejected.
+    If ``rate_limit`` is not configured, ``DEFAULT_RATE_LIMIT`` is applied per parallel connection, so all connections
+    may log in at once. A configured global burst below a number of parallel connections is reported, as connections
+    then wait for a login budget.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param int connections: maximum number of parallel connections
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: rate limiter object, ``None`` if no budget is configured
+    :rtype: RateLimiter or None
+    :raise Exception: ``exc`` incorrect rate limit structure, connections will not be limited
+    """
+    def create_bucket(budget: dict[str, Any]) -> TokenBucket:
+        rate, burst = float(budget['rate']), int(budget.get('burst', 1))
+        # a negative rate would make callers wait for a negative time
+        if rate < 0 or burst < 1:
+            raise ValueError(f"rate {rate}, burst {burst} (rate must be at least 0, burst at least 1)")
+        return TokenBucket(rate, burst)
+
+    settings = _config.get('rate_limit')
+    if settings is None:
+        settings = {key: value * connections for key, value in DEFAULT_RATE_LIMIT.items()}
+    try:
+        global_bucket = None
+        if settings.get('rate'):
+            global_bucket = create_bucket(settings)
+        type_buckets = {device_type: create_bucket(budget)
+                        for device_type, budget in settings.get('device_types', {}).items() if budget.get('rate')}
+    except Exception as exc:
+        log.warning(f"incorrect [rate_limit] value: {str(exc)}, connections will not be limited")
+        return None
+    if not global_bucket and not type_buckets:
+        log.info(f"connections rate is not limited")
+        return None
+    log.info(f"connections rate limited: {settings.get('rate') or 'no'} global login(s) per second,"
+             f" {len(type_buckets)} device type budget(s)")
+    if global_bucket and global_bucket.burst < connections:
+        log.warning(f"[rate_limit] allows {global_bucket.burst} login(s) at once for {connections} parallel"
+                    f" connections, connections will wait for a login budget: raise its burst and rate or set rate"
+                    f" to 0 to disable a limit")
+    return RateLimiter(global_bucket, type_buckets)
+
+
+# ---------------------------------
+# adaptive concurrency
+# ---------------------------------
+class AdaptiveController:
+    """
+    AIMD (additive increase, multiplicative decrease) controller of a number of devices queried in parallel.
+    Level is raised by one after a level's worth of devices completed with a stable latency, and halved when
+    recent latency rises well above its long-term baseline or timeouts and authentication failures spike.
+    """
+
+    def __init__(self, log: logging.Logger, level: int, min_workers: int, max_workers: int) -> None:
+        self.log = log
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.level = min(max(level, min_workers), max_workers)
+        self.credit = 0.0
+        self.baseline = None
+        self.recent = None
+        self.outcomes = deque(maxlen=ADAPTIVE_WINDOW)
+        self.lock = threading.Lock()
+
+    def observe(self, _json: dict[str, Any], elapsed: float, failure: str | None) -> None:
+        """
+        Device outcome observer: update latency averages and adjust concurrency level.
+
+        :param _json: request details dict
+        :param float elapsed: device processing time, in seconds
+        :param failure: failure kind: ``timeout``, ``auth``, ``reset``, ``error`` or ``None`` if details were obtained
+        :type _json: dict[str, Any]
+        :type failure: str or None
+        """
+        with self.lock:
+            # only timeouts and authentication failures indicate network or AAA server overload
+            self.outcomes.append(failure in ('timeout', 'auth'))
+            if failure is None:
+                # slow moving baseline and fast moving recent latency averages
+                self.baseline = elapsed if self.baseline is None else 0.95 * self.baseline + 0.05 * elapsed
+                self.recent = elapsed if self.recent is None else 0.7 * self.recent + 0.3 * elapsed
+            if len(self.outcomes) < ADAPTIVE_WINDOW // 4:
+                return
+            failures = sum(self.outcomes)
+            if failures / len(self.outcomes) > ADAPTIVE_FAILURE_RATIO:
+                self.decrease(f"{failures}/{len(self.outcomes)} recent devices timed out or failed authentication")
+            elif self.recent and self.recent > self.baseline * ADAPTIVE_LATENCY_FACTOR:
+                self.decrease(f"recent latency {self.recent:.1f}s above {self.baseline:.1f}s baseline")
+            elif failure is None:
+                self.credit += 1 / self.level
+                if self.credit >= 1:
+                    self.credit = 0.0
+                    self.change(self.level + 1, "latency stable")
+
+    def decrease(self, reason: str) -> None:
+        """
+        Halve concurrency level, then start a new observation window so a single spike backs off only once.
+
+        :param str reason: level change reason
+        """
+        self.outcomes.clear()
+        self.recent = self.baseline
+        self.credit = 0.0
+        self.change(self.level // 2, reason)
+
+    def change(self, level: int, reason: str) -> None:
+        """
+        Set concurrency level within configured bounds, log a level change.
+
+        :param int level: requested concurrency level
+        :param str reason: level change reason
+        """
+        level = min(max(level, self.min_workers), self.max_workers)
+        if level != self.level:
+            self.log.info(f"adaptive concurrency: {self.level} -> {level} parallel connection(s) ({reason})")
+            self.level = level
+
+
+def get_adaptive_controller(log: logging.Logger, _config: dict[str, Any], max_workers: int,
+                            bulkheads: dict[str, dict[str, int]]) -> AdaptiveController | None:
+    """
+    Create adaptive concurrency controller from a config file content, starting at ``max_workers`` level.
+    Adaptive concurrency does not apply to device types queried in bulkheads.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param int max_workers: initial number of devices queried in parallel
+    :param bulkheads: bulkhead settings per device type
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :type bulkheads: dict[str, dict[str, int]]
+    :return: adaptive concurrency controller, ``None`` if not enabled
+    :rtype: AdaptiveController or None
+    """
+    settings = _config.get('adaptive') or {}
+    if not settings.get('enabled'):
+        return None
+    if bulkheads:
+        log.warning(f"adaptive concurrency is not applied together with [bulkheads], fixed limits will be used")
+        return None
+    min_workers = settings.get('min_workers', 1)
+    max_workers_limit = settings.get('max_workers', max_workers)
+    if not all(isinstance(value, int) and not isinstance(value, bool) for value in (min_workers, max_workers_limit)) \
+            or not 1 <= min_workers <= max_workers_limit:
+        log.warning(f"incorrect [adaptive] value: {settings}, fixed number of parallel connections will be used")
+        return None
+    log.info(f"adaptive concurrency between {min_workers} and {max_workers_limit} parallel connection(s)")
+    return AdaptiveController(log, max_workers, min_workers, max_workers_limit)
+
+
+# ---------------------------------
+# circuit breaker
+# ---------------------------------
+BREAKER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS breaker (
+    host TEXT PRIMARY KEY,
+    failures INTEGER NOT NULL,
+    failure TEXT NOT NULL,
+    retry_at REAL NOT NULL
+);
+"""
+
+
+class CircuitBreaker:
+    """
+    Persistent per host circuit breaker, kept in a SQLite file so that all threads, worker processes and script
+    runs share it. A host failing with a timeout or an authentication error is skipped until its retry window
+    elapses; the window doubles with each consecutive failure, a successful run closes a breaker.
+    """
+
+    def __init__(self, path: str, base_delay: float, max_delay: float) -> None:
+        self.path = path
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        with closing(self.connect()) as connection:
+            connection.executescript(BREAKER_SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open breaker database connection, a new one per call so it can be used from any thread.
+
+        :return: breaker database connection
+        :rtype: sqlite3.Connection
+        """
+        return sqlite3.connect(self.path, timeout=60)
+
+    def split_requests(self, log: logging.Logger, requests: list[dict[str, Any]]
+                       ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Split provided requests into devices to be queried and devices skipped due to an open breaker.
+
+        :param log: log object
+        :param requests: list of request details dicts, one per device
+        :type log: logging.Logger
+        :type requests: list[dict[str, Any]]
+        :return: allowed and skipped devices requests, keeping provided order
+        :rtype: tuple[list[dict[str, Any]], list[dict[str, Any]]]
+        """
+        with closing(self.connect()) as connection:
+            open_hosts = {row[0]: row[1:] for row in connection.execute(
+                "SELECT host, failures, failure, retry_at FROM breaker WHERE retry_at > ?", (time.time(),))}
+        allowed = [_json for _json in requests if _json['host'] not in open_hosts]
+        skipped = [_json for _json in requests if _json['host'] in open_hosts]
+        for _json in skipped:
+            failures, failure, retry_at = open_hosts[_json['host']]
+            log.warning(f"> {_json['host']}: skipped, breaker open after {failures} {failure} failure(s) until"
+                        f" {datetime.fromtimestamp(retry_at).strftime('%Y-%m-%d %H:%M:%S')}")
+        log.info(f"circuit breaker: {len(allowed)}/{len(requests)} device(s) allowed")
+        return allowed, skipped
+
+    def observe(self, _json: dict[str, Any], elapsed: float, failure: str | None) -> None:
+        """
+        Device outcome observer: open or extend a breaker on timeouts and authentication failures,
+        close it on success. Other failures do not change breaker state.
+
+        :param _json: request details dict
+        :param float elapsed: device processing time, in seconds
+        :param failure: failure kind: ``timeout``, ``auth``, ``reset``, ``error`` or ``None`` if details were obtained
+        :type _json: dict[str, Any]
+        :type failure: str or None
+        """
+        with closing(self.connect()) as connection, connection:
+            if failure is None:
+                connection.execute("DELETE FROM breaker WHERE host = ?", (_json['host'],))
+            elif failure in ('timeout', 'auth'):
+                # retry window doubles with each consecutive failure: base_delay * 2 ^ (failures - 1)
+                connection.execute("INSERT INTO breaker (host, failures, failure, retry_at) "
+                                   "VALUES (:host, 1, :failure, :now + MIN(:max_delay, :base_delay)) "
+                                   "ON CONFLICT (host) DO UPDATE SET failures = breaker.failures + 1, "
+                                   "failure = excluded.failure, "
+                                   "retry_at = :now + MIN(:max_delay, :base_delay * (1 << MIN(breaker.failures, 30)))",
+                                   {'host': _json['host'], 'failure': failure, 'now': time.time(),
+                                    'base_delay': self.base_delay, 'max_delay': self.max_delay})
+
+
+def get_circuit_breaker(log: logging.Logger, _config: dict[str, Any]) -> CircuitBreaker | None:
+    """
+    Create circuit breaker from a config file content. Relative breaker path is resolved against a script directory.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: circuit breaker, ``None`` if not enabled or cannot be opened
+    :rtype: CircuitBreaker or None
+    :raise Exception: ``exc`` breaker file creation issue, devices will not be skipped
+    """
+    settings = {**DEFAULT_BREAKER, **(_config.get('breaker') or {})}
+    if not settings['enabled']:
+        return None
+    try:
+        return CircuitBreaker(str(Path(__file__).parent / settings['path']), float(settings['base_delay']),
+                              float(settings['max_delay']))
+    except Exception as exc:
+        log.warning(f"cannot open circuit breaker [{settings['path']}]: {str(exc)}, devices will not be skipped")
+        return None
+
+
+# ---------------------------------
+# checkpoint
+# ---------------------------------
+CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS devices (
+    device_type TEXT NOT NULL,
+    host TEXT NOT NULL,
+    details TEXT NOT NULL,
+    collected_at REAL NOT NULL,
+    PRIMARY KEY (device_type, host)
+);
+CREATE TABLE IF NOT EXISTS completed (
+    completed_at REAL NOT NULL
+);
+"""
+
+
+class Checkpoint:
+    """
+    Persistent store of collected device details, kept in a SQLite file and written as soon as each device is
+    processed, so that an interrupted run can be resumed without querying collected devices again.
+    Holds a file path only, so its recording method can be passed to worker processes.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with closing(self.connect()) as connection:
+            connection.executescript(CHECKPOINT_SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open checkpoint database connection, a new one per call so it can be used from any thread or process.
+
+        :return: checkpoint database connection
+        :rtype: sqlite3.Connection
+        """
+        return sqlite3.connect(self.path, timeout=60)
+
+    def clear(self, log: logging.Logger) -> None:
+        """
+        Remove device details of a previous run, starting a new checkpoint.
+
+        :param log: log object
+        :type log: logging.Logger
+        """
+        with closing(self.connect()) as connection, connection:
+            removed = connection.execute("DELETE FROM devices").rowcount
+            connection.execute("DELETE FROM completed")
+        if removed:
+            log.info(f"checkpoint: {removed} device(s) of a previous run removed")
+
+    def split_requests(self, log: logging.Logger, requests: list[dict[str, Any]],
+                       sink: DeviceSink) -> list[dict[str, Any]]:
+        """
+        Split provided requests into devices still to be queried and devices restored from a checkpoint.
+        Details of restored devices are handed over to a provided sink one by one, in request order.
+
+        :param log: log object
+        :param requests: list of request details dicts, one per device
+        :param sink: device details sink receiving restored devices
+        :type log: logging.Logger
+        :type requests: list[dict[str, Any]]
+        :type sink: DeviceSink
+        :return: pending devices requests, keeping provided order
+        :rtype: list[dict[str, Any]]
+        """
+        with closing(self.connect()) as connection:
+            completed = connection.execute("SELECT MAX(completed_at) FROM completed").fetchone()[0]
+        # a finished run has nothing to resume, its devices would be exported again as stale data
+        if completed:
+            finished = datetime.fromtimestamp(completed)
+            log.warning(f"checkpoint: previous run completed {finished.strftime('%Y-%m-%d %H:%M:%S')}, nothing to"
+                        f" resume: all devices will be queried")
+            self.clear(log)
+            return requests
+        with closing(self.connect()) as connection:
+            collected = {(row[0], row[1]): row[2] for row in connection.execute(
+                "SELECT device_type, host, collected_at FROM devices")}
+            restored = {(_json['device_type'], _json['host']): _json for _json in requests
+                        if (_json['device_type'], _json['host']) in collected}
+            if collected:
+                started = datetime.fromtimestamp(min(collected.values()))
+                log.info(f"checkpoint: {len(restored)}/{len(requests)} device(s) restored from a run started"
+                         f" {started.strftime('%Y-%m-%d %H:%M:%S')}")
+            else:
+                log.info("checkpoint: no collected devices to resume, all devices will be queried")
+            # each device is read with a primary key lookup, so only one device at a time is held in memory
+            for key, _json in restored.items():
+                details = connection.execute("SELECT details FROM devices WHERE device_type = ? AND host = ?",
+                                             key).fetchone()[0]
+                sink(_json, DeviceDetails.from_list(json.loads(details)))
+        return [_json for _json in requests if (_json['device_type'], _json['host']) not in restored]
+
+    def complete(self) -> None:
+        """
+        Mark a checkpoint run as completed, so a following ``--resume`` run starts a new checkpoint instead.
+        """
+        with closing(self.connect()) as connection, connection:
+            connection.execute("INSERT INTO completed (completed_at) VALUES (?)", (time.time(),))
+
+    def record(self, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        """
+        Device details sink: store details of a device, devices with no data obtained are not stored,
+        so a resumed run queries them again.
+
+        :param _json: request details dict
+        :param details: device details, optional
+        :type _json: dict[str, Any]
+        :type details: DeviceDetails or None
+        """
+        if not details:
+            return
+        with closing(self.connect()) as connection, connection:
+            connection.execute("INSERT OR REPLACE INTO devices (device_type, host, details, collected_at) "
+                               "VALUES (?, ?, ?, ?)",
+                               (_json['device_type'], _json['host'], json.dumps(details.to_list()), time.time()))
+
+
+def get_checkpoint(log: logging.Logger, _config: dict[str, Any]) -> Checkpoint | None:
+    """
+    Create checkpoint from a config file content. Relative checkpoint path is resolved against a script directory.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: checkpoint, ``None`` if not enabled or cannot be opened
+    :rtype: Checkpoint or None
+    :raise Exception: ``exc`` checkpoint file creation issue, run will not be resumable
+    """
+    settings = {**DEFAULT_CHECKPOINT, **(_config.get('checkpoint') or {})}
+    if not settings['enabled']:
+        return None
+    try:
+        return Checkpoint(str(Path(__file__).parent / settings['path']))
+    except Exception as exc:
+        log.warning(f"cannot open checkpoint [{settings['path']}]: {str(exc)}, run will not be resumable")
+        return None
+
+
+# ---------------------------------
+# version cache
+# ---------------------------------
+# serial number and model are kept without a show version output hash: output holds an uptime changing on every run,
+# and parsing it costs less than a cache lookup
+VERSION_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS version_details (
+    host TEXT PRIMARY KEY,
+    serial_number TEXT,
+    model TEXT,
+    checked_at REAL NOT NULL
+);
+"""
+# version cache connections per thread, keyed by a cache file path
+VERSION_CACHES = threading.local()
+
+
+def get_version_cache_settings(_config: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Read version cache settings from a config file content, completed with default values.
+    Relative cache path is resolved against a script directory.
+
+    :param _config: configuration file content dict
+    :type: _config: dict[str, Any]
+    :return: version cache settings dict, ``None`` if not enabled
+    :rtype: dict[str, Any] or None
+    """
+    settings = {**DEFAULT_VERSION_CACHE, **(_config.get('version_cache') or {})}
+    if not settings['enabled']:
+        return None
+    return {'path': str(Path(__file__).parent / settings['path']), 'ports_only': bool(settings['ports_only']),
+            'ttl': float(settings['ttl'])}
+
+
+def open_version_cache(path: str) -> sqlite3.Connection:
+    """
+    Obtain version cache database connection of a current thread, opening it and creating its schema on a first call.
+    Each thread keeps its own connection for a whole run, so it can be used from any thread or process.
+
+    :param str path: version cache file path
+    :return: version cache database connection
+    :rtype: sqlite3.Connection
+    """
+    if not hasattr(VERSION_CACHES, 'connections'):
+        VERSION_CACHES.connections = {}
+    connections = VERSION_CACHES.connections
+    connection = connections.get(path)
+    if connection is None:
+        connection = sqlite3.connect(path, timeout=60)
+        connection.executescript(VERSION_CACHE_SCHEMA)
+        connections[path] = connection
+    return connection
+
+
+def get_cached_version(log: logging.Logger, _json: dict[str, Any]) -> tuple[str | None, str | None] | None:
+    """
+    In a ports-only mode, return serial number and model cached for a device, if its ``show version`` output was
+    checked within a configured TTL; ``show version`` is not sent to such a device.
+
+    :param log: log object
+    :param _json: request details dict
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :return: cached serial number and model, ``None`` if version has to be checked
+    :rtype: tuple[str | None, str | None] or None
+    :raise Exception: ``exc`` version cache read issue, version will be checked
+    """
+    settings = _json.get('version_cache')
+    if not settings or not settings['ports_only']:
+        return None
+    try:
+        row = open_version_cache(settings['path']).execute(
+            "SELECT serial_number, model FROM version_details WHERE host = ? AND checked_at > ?",
+            (_json['host'], time.time() - settings['ttl'])).fetchone()
+    except Exception as exc:
+        log.warning(f"> {_json['host']}: cannot read version cache: {str(exc)}")
+        return None
+    if row:
+        log.info(f"> {_json['host']}: version check skipped, cached serial number and model used")
+        return row[0], row[1]
+    return None
+
+
+def parse_version(log: logging.Logger, _json: dict[str, Any], version_info: str) -> tuple[str, str]:
+    """
+    Obtain serial number and model from ``show version`` output. If a version cache is enabled, parsed details are
+    cached with a check time, unless a detail held by a device type output was not found: such a device is checked
+    again by a next run, so a parser fix is not hidden by a cached ``No data``.
+
+    :param log: log object
+    :param _json: request details dict
+    :param str version_info: device version info output
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :return: serial number and model
+    :rtype: tuple[str, str]
+    :raise Exception: ``exc`` version cache write issue, device version will be checked again by a next run
+    """
+    details = get_version_details(log, _json['host'], version_info, _json['device_type'])
+    settings = _json.get('version_cache')
+    if not settings:
+        return details['serial'], details['model']
+    _, reported = VERSION_PARSERS.get(_json['device_type']) or VERSION_PARSERS[DEFAULT_VERSION_PARSER]
+    if all(details[detail] != 'No data' for detail in reported):
+        try:
+            connection = open_version_cache(settings['path'])
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO version_details (host, serial_number, model, checked_at) "
+                                   "VALUES (?, ?, ?, ?)", (_json['host'], details['serial'], details['model'],
+                                                           time.time()))
+        except Exception as exc:
+            log.warning(f"> {_json['host']}: cannot write version cache: {str(exc)}")
+    return details['serial'], details['model']
+
+
+# ---------------------------------
+# TextFSM template cache
+# ---------------------------------
+# compiled TextFSM templates per (device type, command), shared by all devices handled by a process
+# ``None`` marks commands parsed by netmiko itself: without a single matching template or failed to compile
+TEXTFSM_TEMPLATES: dict[tuple[str, str], 'tuple[TextFSM, threading.Lock] | None'] = {}
+TEXTFSM_TEMPLATES_LOCK = threading.Lock()
+
+
+def get_textfsm_template(log: logging.Logger, device_type: str, command: str) -> \
+        'tuple[TextFSM, threading.Lock] | None':
+    """
+    Obtain a compiled TextFSM template of a command, with a lock guarding its parsing state.
+    Template is located in the ntc-templates index and compiled on a first request only, later requests of any device
+    are served from a process-wide cache.
+
+    :param log: log object
+    :param str device_type: netmiko device type
+    :param str command: command the template parses output of
+    :type log: logging.Logger
+    :return: compiled template and its lock, or None if output is to be parsed by netmiko
+    :rtype: tuple[TextFSM, threading.Lock] or None
+    :raise Exception: ``exc`` template lookup or compilation failed, netmiko parsing is used instead
+    """
+    key = (device_type, command)
+    # cached templates are read without a lock
+    if key in TEXTFSM_TEMPLATES:
+        return TEXTFSM_TEMPLATES[key]
+    with TEXTFSM_TEMPLATES_LOCK:
+        if key not in TEXTFSM_TEMPLATES:
+            try:
+                TEXTFSM_TEMPLATES[key] = compile_textfsm_template(device_type, command)
+            except Exception as exc:
+                log.warning(f"cannot compile TextFSM template of {device_type} '{command}', netmiko parsing will be"
+                            f" used: {str(exc)}")
+                TEXTFSM_TEMPLATES[key] = None
+    return TEXTFSM_TEMPLATES[key]
+
+
+def compile_textfsm_template(device_type: str, command: str) -> 'tuple[TextFSM, threading.Lock] | None':
+    """
+    Locate a command template in the ntc-templates index the way netmiko does and compile it.
+    Command abbreviations are matched by the index, ``cisco_xe`` commands without a dedicated template are parsed with
+    a ``cisco_ios`` one.
+
+    :param str device_type: netmiko device type
+    :param str command: command the template parses output of
+    :return: compiled template and its lock, or None if there is no single matching template
+    :rtype: tuple[TextFSM, threading.Lock] or None
+    """
+    template_dir = get_template_dir()
+    index = clitable.CliTable('index', template_dir).index
+    platforms = [device_type, 'cisco_ios'] if 'cisco_xe' in device_type else [device_type]
+    for platform in platforms:
+        row = index.GetRowMatch({'Command': command, 'Platform': platform})
+        # row 0 is an index header, returned when no row matches
+        if not row:
+            continue
+        names = index.index[row]['Template'].split(':')
+        # results of several templates are merged by netmiko
+        if len(names) > 1:
+            return None
+        with open(os.path.join(template_dir, names[0]), encoding='utf-8') as template:
+            return TextFSM(template), threading.Lock()
+    return None
+
+
+def parse_structured_data(log: logging.Logger, output: str, device_type: str, command: str) -> \
+        list[dict[str, str]] | str:
+    """
+    Parse raw command output with a cached TextFSM template, into records keyed by lowercase template value names,
+    as netmiko ``use_textfsm=True`` does. Output is returned unchanged if nothing was parsed, as by netmiko.
+
+    :param log: log object
+    :param str output: raw command output
+    :param str device_type: netmiko device type
+    :param str command: command the output comes from
+    :type log: logging.Logger
+    :return: parsed records or raw output
+    :rtype: list[dict[str, str]] or str
+    """
+    cached = get_textfsm_template(log, device_type, command)
+    if not cached:
+        return get_structured_data(output, platform=device_type, command=command)
+    template, lock = cached
+    # template holds its parsing state, devices parsed at once in threads take turns
+    with lock:
+        template.Reset()
+        header = [name.lower() for name in template.header]
+        rows = template.ParseText(output)
+    return [dict(zip(header, row)) for row in rows] or output
+
+
+# ---------------------------------
+# parse pool
+# ---------------------------------
+class ParsePool:
+    """
+    Process pool parsing raw device outputs, decoupled from connection workers which only fetch them, so parsing
+    does not compete with connection threads for the GIL. A connection worker hands outputs over and moves on to its
+    next device at once, a device outcome is settled from a job done callback. Outputs handed over to the pool at once
+    are bounded by ``queue_depth``: once parsers fall behind, connection workers wait for a free slot, keeping memory
+    bounded.
+    Parser process logs are forwarded to a main process log handlers.
+    """
+
+    def __init__(self, log: logging.Logger, processes: int, queue_depth: int) -> None:
+        """
+        :param log: log object
+        :param int processes: number of parser processes
+        :param int queue_depth: maximum number of outputs handed over to parser processes at once
+        :type log: logging.Logger
+        """
+        self.log_name = log.name
+        self.slots = threading.BoundedSemaphore(queue_depth)
+        self.async_slots = asyncio.Semaphore(queue_depth)
+        self.log_queue = multiprocessing.Queue()
+        self.listener = QueueListener(self.log_queue, *log.handlers)
+        self.executor = ProcessPoolExecutor(max_workers=processes, initializer=init_worker_log,
+                                            initargs=(self.log_queue, log.name))
+
+    def __enter__(self) -> 'ParsePool':
+        self.listener.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.executor.shutdown()
+        self.listener.stop()
+
+    def submit(self, log: logging.Logger, _json: dict[str, Any], cached: tuple[str, str] | None,
+               version_info: str | None, output: str | None) -> Future:
+        """
+        Hand raw device outputs over to a parser process once a slot is free, without waiting for them to be parsed.
+
+        :param log: log object
+        :param _json: request details dict
+        :param cached: cached serial number and model, optional
+        :param version_info: raw show version output, optional
+        :param output: raw show interfaces status output, optional
+        :type log: logging.Logger
+        :type _json: dict[str, Any]
+        :type cached: tuple[str, str] or None
+        :type version_info: str or None
+        :type output: str or None
+        :return: future resolving to specific device details, optional
+        :rtype: Future
+        """
+        self.slots.acquire()
+        return self.hand_over(log, _json, cached, version_info, output, self.slots.release)
+
+    async def submit_async(self, log: logging.Logger, _json: dict[str, Any], cached: tuple[str, str] | None,
+                           version_info: str | None, output: str | None) -> asyncio.Future:
+        """
+        Asyncio counterpart of ``submit``: an event loop keeps running while outputs wait for a slot,
+        a slot is given back to an event loop once outputs are parsed.
+
+        :param log: log object
+        :param _json: request details dict
+        :param cached: cached serial number and model, optional
+        :param version_info: raw show version output, optional
+        :param output: raw show interfaces status output, optional
+        :type log: logging.Logger
+        :type _json: dict[str, Any]
+        :type cached: tuple[str, str] or None
+        :type version_info: str or None
+        :type output: str or None
+        :return: event loop future resolving to specific device details, optional
+        :rtype: asyncio.Future
+        """
+        await self.async_slots.acquire()
+        loop = asyncio.get_running_loop()
+        return asyncio.wrap_future(self.hand_over(log, _json, cached, version_info, output,
+                                                  partial(loop.call_soon_threadsafe, self.async_slots.release)),
+                                   loop=loop)
+
+    def hand_over(self, log: logging.Logger, _json: dict[str, Any], cached: tuple[str, str] | None,
+                  version_info: str | None, output: str | None, release: Callable[[], None]) -> Future:
+        """
+        Submit a parse job holding an already taken slot; a slot is released by a job done callback, before
+        a returned future resolves. Outputs are parsed locally if a parser process cannot be used.
+
+        :param log: log object
+        :param _json: request details dict
+        :param cached: cached serial number and model, optional
+        :param version_info: raw show version output, optional
+        :param output: raw show interfaces status output, optional
+        :param release: function releasing a taken slot
+        :type log: logging.Logger
+        :type _json: dict[str, Any]
+        :type cached: tuple[str, str] or None
+        :type version_info: str or None
+        :type output: str or None
+        :type release: Callable[[], None]
+        :return: future resolving to specific device details, optional
+        :rtype: Future
+        :raise Exception: ``exc`` parser process failure, outputs are parsed locally
+        """
+        parsed = Future()
+
+        def resolve(job: Future) -> None:
+            release()
+            try:
+                details = job.result()
+            except Exception as exc:
+                log.warning(f"> {_json['host']}: parse pool failure, parsing locally: {str(exc)}")
+                details = parse_device_outputs(log, _json, cached, version_info, output)
+            parsed.set_result(details)
+
+        try:
+            job = self.executor.submit(parse_outputs_worker, self.log_name, _json, cached, version_info, output)
+        except Exception as exc:
+            job = Future()
+            job.set_exception(exc)
+        job.add_done_callback(resolve)
+        return parsed
+
+
+def parse_outputs_worker(log_name: str, _json: dict[str, Any], cached: tuple[str, str] | None,
+                         version_info: str | None, output: str | None) -> 'DeviceDetails | None':
+    """
+    Parser process entry point: parse raw outputs of a single device.
+
+    :param str log_name: main process log object name
+    :param _json: request details dict
+    :param cached: cached serial number and model, optional
+    :param version_info: raw show version output, optional
+    :param output: raw show interfaces status output, optional
+    :type _json: dict[str, Any]
+    :type cached: tuple[str, str] or None
+    :type version_info: str or None
+    :type output: str or None
+    :return: specific device details, optional
+    :rtype: DeviceDetails or None
+    """
+    return parse_device_outputs(logging.getLogger(log_name), _json, cached, version_info, output)
+
+
+def get_parse_pool_settings(log: logging.Logger, _config: dict[str, Any]) -> dict[str, int] | None:
+    """
+    Read parse pool settings from a config file content, completed with default values; ``auto`` number of
+    processes matches available CPU cores.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: parse pool settings dict, ``None`` if outputs are parsed by connection workers
+    :rtype: dict[str, int] or None
+    """
+    settings = {**DEFAULT_PARSE_POOL, **(_config.get('parse_pool') or {})}
+    if settings['processes'] == 'auto':
+        settings['processes'] = os.cpu_count() or 1
+    if not settings['processes']:
+        return None
+    if not all(isinstance(settings[key], int) and not isinstance(settings[key], bool) and settings[key] > 0
+               for key in ('processes', 'queue_depth')):
+        log.warning(f"incorrect [parse_pool] value: {settings}, outputs will be parsed by connection workers")
+        return None
+    log.info(f"outputs will be parsed by {settings['processes']} parser process(es), up to"
+             f" {settings['queue_depth']} at once")
+    return {key: settings[key] for key in DEFAULT_PARSE_POOL}
+
+
+# ---------------------------------
+# raw output capture
+# ---------------------------------
+CAPTURE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    device_type TEXT NOT NULL,
+    host TEXT NOT NULL,
+    command TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs (digest),
+    captured_at REAL NOT NULL,
+    PRIMARY KEY (device_type, host, command)
+);
+CREATE INDEX IF NOT EXISTS outputs_digest ON outputs (digest);
+"""
+
+
+def get_capture_settings(_config: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Read raw output capture settings from a config file content, completed with default values.
+    Relative capture path is resolved against a script directory.
+
+    :param _config: configuration file content dict
+    :type: _config: dict[str, Any]
+    :return: capture settings dict, ``None`` if not enabled
+    :rtype: dict[str, Any] or None
+    """
+    settings = {**DEFAULT_CAPTURE, **(_config.get('capture') or {})}
+    if not settings['enabled']:
+        return None
+    return {'path': str(Path(__file__).parent / settings['path'])}
+
+
+def open_capture_store(path: str) -> sqlite3.Connection:
+    """
+    Open capture store database connection, creating its schema if needed.
+    A new connection is opened per call, so it can be used from any thread or process.
+
+    :param str path: capture store file path
+    :return: capture store database connection
+    :rtype: sqlite3.Connection
+    """
+    connection = sqlite3.connect(path, timeout=60)
+    connection.executescript(CAPTURE_SCHEMA)
+    return connection
+
+
+def store_captures(log: logging.Logger, _json: dict[str, Any], outputs: dict[str, str | None]) -> None:
+    """
+    Store raw outputs of a device, replacing its previously captured ones. Outputs are gzip compressed and addressed
+    by their hash, so identical outputs of any devices are stored once; replaced outputs no longer referenced by any
+    device are deleted within the same transaction, so only the latest outputs are kept.
+
+    :param log: log object
+    :param _json: request details dict
+    :param outputs: raw output per command, missing outputs are skipped
+    :type log: logging.Logger
+    :type _json: dict[str, Any]
+    :type outputs: dict[str, str | None]
+    :raise Exception: ``exc`` capture store write issue, outputs are not captured
+    """
+    blobs = []
+    rows = []
+    for command, output in outputs.items():
+        if output is None:
+            continue
+        data = output.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        blobs.append((digest, gzip.compress(data)))
+        rows.append((_json['device_type'], _json['host'], command, digest, time.time()))
+    try:
+        with closing(open_capture_store(_json['capture']['path'])) as connection, connection:
+            replaced = [row[0] for row in connection.execute(
+                "SELECT digest FROM outputs WHERE device_type = ? AND host = ?", (_json['device_type'], _json['host']))]
+            connection.executemany("INSERT OR IGNORE INTO blobs (digest, data) VALUES (?, ?)", blobs)
+            connection.executemany("INSERT OR REPLACE INTO outputs (device_type, host, command, digest, captured_at) "
+                                   "VALUES (?, ?, ?, ?, ?)", rows)
+            connection.executemany("DELETE FROM blobs WHERE digest = ? "
+                                   "AND NOT EXISTS (SELECT 1 FROM outputs WHERE outputs.digest = blobs.digest)",
+                                   [(digest,) for digest in set(replaced)])
+    except Exception as exc:
+        log.warning(f"> {_json['host']}: cannot capture raw outputs: {str(exc)}")
+
+
+def load_captures(connection: sqlite3.Connection, device_type: str, host: str) -> dict[str, str]:
+    """
+    Load latest captured raw outputs of a device.
+
+    :param connection: capture store database connection
+    :param str device_type: netmiko device type
+    :param str host: device IP address
+    :type connection: sqlite3.Connection
+    :return: raw output per command
+    :rtype: dict[str, str]
+    """
+    rows = connection.execute("SELECT command, data FROM outputs JOIN blobs USING (digest) "
+                              "WHERE device_type = ? AND host = ?", (device_type, host))
+    return {command: gzip.decompress(data).decode('utf-8') for command, data in rows}
+
+
+def execute_reparse(log: logging.Logger, _config: dict[str, Any], writer: 'ReportWriter') -> None:
+    """
+    Rebuild reports of configured devices from their captured raw outputs, without any connection: outputs are parsed
+    with current parsers, so a parsing fix is applied without querying devices again. Version cache is bypassed,
+    outputs are not captured again and no credentials are required. Devices without captured outputs are listed
+    in a status report.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param writer: report writer
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :type writer: ReportWriter
+    :raise Exception: ``exc`` capture store read issue, reports are not rebuilt
+    """
+    # devices are read directly, no credentials are needed offline
+    _devices = _config.get('devices') or {}
+    path = Path(__file__).parent / {**DEFAULT_CAPTURE, **(_config.get('capture') or {})}['path']
+    if not path.exists():
+        log.warning(f"capture store [{path}] not found, nothing to reparse")
+        return
+    missing = []
+    started = time.monotonic()
+    try:
+        with closing(open_capture_store(str(path))) as connection:
+            for device_type in _devices:
+                for host in _devices[device_type]:
+                    _json = {'device_type': device_type, 'host': host}
+                    outputs = load_captures(connection, device_type, host)
+                    if "show interfaces status" not in outputs:
+                        missing.append(_json)
+                        continue
+                    writer.record(_json, parse_device_outputs(log, _json, None, outputs.get("show version"),
+                                                              outputs["show interfaces status"]))
+    except Exception as exc:
+        log.critical(f"cannot read capture store [{path}]: {str(exc)}")
+        return
+    log.info(f"reports rebuilt from captured outputs in {time.monotonic() - started:.1f}s,"
+             f" {len(missing)} device(s) without captures")
+    writer.write(STATUS_SUBJECT, STATUS_HEADER, [[_json['host'], _json['device_type'], "no captured outputs"]
+                                                 for _json in missing])
+
+
+# ---------------------------------
+# inventory store
+# ---------------------------------
+INVENTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS devices (
+    device_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    host TEXT NOT NULL,
+    device_type TEXT NOT NULL,
+    serial_number TEXT,
+    model TEXT
+);
+CREATE TABLE IF NOT EXISTS ports (
+    device_id INTEGER NOT NULL REFERENCES devices (device_id),
+    port TEXT NOT NULL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS devices_run_id ON devices (run_id);
+CREATE INDEX IF NOT EXISTS devices_host ON devices (host);
+CREATE INDEX IF NOT EXISTS devices_serial_number ON devices (serial_number);
+CREATE INDEX IF NOT EXISTS ports_device_id ON ports (device_id);
+CREATE INDEX IF NOT EXISTS ports_status ON ports (status);
+"""
+
+
+class InventoryStore:
+    """
+    Inventory history kept in a SQLite file alongside exported reports: each run adds normalised device and port
+    rows, indexed by IP, serial number and run time, so inventories can be queried across runs.
+    Devices are buffered and inserted in batches, each within a single transaction, over one connection
+    in WAL mode. Safe to use from multiple threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.connection = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(INVENTORY_SCHEMA)
+        with self.connection:
+            self.run_id = self.connection.execute("INSERT INTO runs (started_at) VALUES (?)",
+                                                  (datetime.now().strftime('%Y-%m-%d %H:%M:%S'),)).lastrowid
+        self.pending = []
+        self.pending_ports = 0
+        self.lock = threading.Lock()
+
+    def record(self, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        """
+        Device details sink: buffer details of a device, inserting buffered devices once a batch is full.
+
+        :param _json: request details dict
+        :param details: device details, optional
+        :type _json: dict[str, Any]
+        :type details: DeviceDetails or None
+        """
+        if not details:
+            return
+        with self.lock:
+            self.pending.append((_json['device_type'], details))
+            self.pending_ports += len(details)
+            if self.pending_ports >= INVENTORY_BATCH_PORTS:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Insert buffered devices and their ports within a single transaction. Called with a lock held.
+        """
+        with self.connection:
+            ports = []
+            for device_type, details in self.pending:
+                device_id = self.connection.execute(
+                    "INSERT INTO devices (run_id, host, device_type, serial_number, model) VALUES (?, ?, ?, ?, ?)",
+                    (self.run_id, details.host, device_type, details.serial_number, details.model)).lastrowid
+                ports += [(device_id, port, status) for port, status in zip(details.ports, details.statuses)]
+            self.connection.executemany("INSERT INTO ports (device_id, port, status) VALUES (?, ?, ?)", ports)
+        self.pending = []
+        self.pending_ports = 0
+
+    def close(self, log: logging.Logger) -> None:
+        """
+        Insert remaining buffered devices and close a store.
+
+        :param log: log object
+        :type log: logging.Logger
+        :raise Exception: ``exc`` inventory store write issue, remaining devices are not stored
+        """
+        with self.lock:
+            try:
+                self.flush()
+                devices = self.connection.execute("SELECT COUNT(*) FROM devices WHERE run_id = ?",
+                                                  (self.run_id,)).fetchone()[0]
+                log.info(f"inventory store: {devices} device(s) stored as run {self.run_id}")
+            except Exception as exc:
+                log.warning(f"cannot store remaining devices in an inventory store: {str(exc)}")
+            finally:
+                self.connection.close()
+
+
+def get_inventory_store(log: logging.Logger, _config: dict[str, Any]) -> InventoryStore | None:
+    """
+    Create inventory store from a config file content. Relative store path is resolved against a script directory.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: inventory store, ``None`` if not enabled or cannot be opened
+    :rtype: InventoryStore or None
+    :raise Exception: ``exc`` store file creation issue, devices will be exported to reports only
+    """
+    settings = {**DEFAULT_INVENTORY, **(_config.get('inventory') or {})}
+    if not settings['enabled']:
+        return None
+    try:
+        return InventoryStore(str(Path(__file__).parent / settings['path']))
+    except Exception as exc:
+        log.warning(f"cannot open inventory store [{settings['path']}]: {str(exc)}, devices will be exported"
+                    f" to reports only")
+        return None
+
+
+# ---------------------------------
 # data export
 # ---------------------------------
-def export_data(log: logging.Logger, data: dict[str, Any]) -> None:
+class ReportWriter:
+    """
+    CSV report files, one per subject, saved in an exports directory. A file is created with its header once first
+    rows of a subject arrive and its handle is kept open for a whole run. Uncompressed rows are flushed as soon as
+    provided, compressed ones as compression buffers fill up, so report content does not accumulate in memory.
+    In an append mode, rows are appended to a daily file per subject, its header written only once.
+    Safe to use from multiple threads.
     """
-    Export data function, saving device info in *.csv format. Files are being dumped in a script directory.
+
+    def __init__(self, log: logging.Logger, directory: Path, compression: str = '', append: bool = False) -> None:
+        self.log = log
+        self.directory = directory
+        self.compression = compression
+        self.append = append
+        self.timestamp = datetime.now().strftime("%Y-%m-%d" if append else "%Y-%m-%d_%H-%M-%S")
+        self.files = {}
+        self.writers = {}
+        self.paths = {}
+        self.lock = threading.Lock()
+
+    def write(self, subject: str, header: list[str], rows: list[list[Any]]) -> None:
+        """
+        Append rows to a subject report file, opening the file (with a header, if new) if needed.
+
+        :param str subject: report subject, used in a file name
+        :param header: report header, written once per file
+        :param rows: report rows
+        :type header: list[str]
+        :type rows: list[list[Any]]
+        """
+        if not rows:
+            return
+        with self.lock:
+            if subject not in self.files:
+                extension = CSV_EXTENSIONS[self.compression]
+                export_path = self.directory / f"{self.timestamp}_{subject}_export.csv{extension}"
+                new_file = not export_path.exists()
+                self.files[subject] = self.open(export_path)
+                self.writers[subject] = csv.writer(self.files[subject])
+                self.paths[subject] = str(export_path)
+                if new_file or not self.append:
+                    self.writers[subject].writerow(header)
+            self.writers[subject].writerows(rows)
+            if not self.compression:
+                self.files[subject].flush()
+
+    def open(self, export_path: Path) -> Any:
+        """
+        Open a report file for writing, or appending in an append mode, compressed as configured.
+
+        :param export_path: report file path
+        :type export_path: Path
+        :return: text file object
+        :rtype: Any
+        """
+        mode = "a" if self.append else "w"
+        if self.compression == 'gzip':
+            return gzip.open(export_path, f"{mode}t", newline="", encoding="utf-8")
+        if self.compression == 'zstd':
+            return zstandard.open(export_path, mode, newline="", encoding="utf-8")
+        return open(export_path, mode, newline="", encoding="utf-8")
+
+    def record(self, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        """
+        Device details sink: write details of a device to its device type report.
+
+        :param _json: request details dict
+        :param details: device details, optional
+        :type _json: dict[str, Any]
+        :type details: DeviceDetails or None
+        """
+        if not details:
+            self.log.warning(f"> {_json['host']}: no device info obtained, skipping")
+            return
+        self.write(_json['device_type'], DEVICE_HEADER, details)
+
+    def close(self) -> list[str]:
+        """
+        Close all report files.
+
+        :return: saved report file paths
+        :rtype: list[str]
+        """
+        with self.lock:
+            for file in self.files.values():
+                file.close()
+            return list(self.paths.values())
+
+
+class ParquetReportWriter(ReportWriter):
+    """
+    Parquet report files, one per subject, saved in an exports directory. Rows are kept in per column buffers,
+    holding references to already interned values, and each file is written as a single row group once a run
+    ends, as columnar files cannot be appended row by row. Columns with repeated values are dictionary encoded,
+    so they load as categorical data.
+    """
+
+    def __init__(self, log: logging.Logger, directory: Path, compression: str = '') -> None:
+        super().__init__(log, directory, compression)
+        self.columns = {}
+
+    def write(self, subject: str, header: list[str], rows: list[list[Any]]) -> None:
+        """
+        Append rows to subject column buffers.
+
+        :param str subject: report subject, used in a file name
+        :param header: report header, used as column names
+        :param rows: report rows
+        :type header: list[str]
+        :type rows: list[list[Any]]
+        """
+        if not rows:
+            return
+        with self.lock:
+            columns = self.columns.setdefault(subject, {name: [] for name in header})
+            for row in rows:
+                for column, value in zip(columns.values(), row):
+                    column.append(value)
+
+    def close(self) -> list[str]:
+        """
+        Write buffered subjects to report files, each as a single row group, compressed as configured.
+
+        :return: saved report file paths
+        :rtype: list[str]
+        """
+        saved = []
+        with self.lock:
+            for subject, columns in self.columns.items():
+                arrays = [pa.array(values, type=pa.string()) for values in columns.values()]
+                table = pa.table([array.dictionary_encode() if name in PARQUET_DICTIONARY_COLUMNS else array
+                                  for name, array in zip(columns, arrays)], names=list(columns))
+                export_path = self.directory / f"{self.timestamp}_{subject}_export.parquet"
+                pq.write_table(table, export_path, row_group_size=max(1, table.num_rows),
+                               compression=self.compression or 'snappy')
+                saved.append(str(export_path))
+            self.columns = {}
+        return saved
+
+
+DELTA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS delta_devices (
+    host TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS delta_ports (
+    host TEXT NOT NULL,
+    port TEXT NOT NULL,
+    status TEXT,
+    PRIMARY KEY (host, port)
+);
+"""
+
+
+class DeltaReport:
+    """
+    Delta report: instead of full device reports, only ports added, removed or changed since a previous run are
+    written, to a single report subject. Last known ports of each device are kept in a SQLite file, together with
+    a hash of a whole device port table, so a device with no changes is compared with a single lookup; otherwise
+    its previous ports are indexed by name, keeping comparison linear with the number of ports.
+    """
+
+    def __init__(self, path: str, writer: ReportWriter) -> None:
+        self.path = path
+        self.writer = writer
+        with closing(self.connect()) as connection:
+            connection.executescript(DELTA_SCHEMA)
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open delta state database connection, a new one per call so it can be used from any thread.
+
+        :return: delta state database connection
+        :rtype: sqlite3.Connection
+        """
+        return sqlite3.connect(self.path, timeout=60)
+
+    def record(self, _json: dict[str, Any], details: 'DeviceDetails | None') -> None:
+        """
+        Device details sink: write port changes of a device since its previous run and store its current ports.
+        Devices with no data obtained keep their previous ports, so no removals are reported for them.
+
+        :param _json: request details dict
+        :param details: device details, optional
+        :type _json: dict[str, Any]
+        :type details: DeviceDetails or None
+        """
+        if not details:
+            self.writer.record(_json, details)
+            return
+        host = _json['host']
+        current = dict(zip(details.ports, details.statuses))
+        digest = hashlib.blake2b(json.dumps(sorted(current.items())).encode('utf-8'), digest_size=16).hexdigest()
+        with closing(self.connect()) as connection, connection:
+            row = connection.execute("SELECT digest FROM delta_devices WHERE host = ?", (host,)).fetchone()
+            if row and row[0] == digest:
+                return
+            previous = dict(connection.execute("SELECT port, status FROM delta_ports WHERE host = ?", (host,)))
+            changes = [[host, port, previous.get(port), status, 'added' if port not in previous else 'changed']
+                       for port, status in current.items() if port not in previous or previous[port] != status]
+            changes += [[host, port, status, None, 'removed'] for port, status in previous.items()
+                        if port not in current]
+            connection.execute("DELETE FROM delta_ports WHERE host = ?", (host,))
+            connection.executemany("INSERT INTO delta_ports (host, port, status) VALUES (?, ?, ?)",
+                                   [(host, port, status) for port, status in current.items()])
+            connection.execute("INSERT OR REPLACE INTO delta_devices (host, digest) VALUES (?, ?)", (host, digest))
+        self.writer.write(DELTA_SUBJECT, DELTA_HEADER, changes)
+        if changes:
+            self.writer.log.info(f"> {host}: {len(changes)} port change(s) since a previous run")
+
+
+def get_delta_report(log: logging.Logger, _config: dict[str, Any], writer: ReportWriter) -> DeltaReport | None:
+    """
+    Create delta report from a config file content. Relative delta state path is resolved against a script
+    directory.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :param writer: report writer
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :type writer: ReportWriter
+    :return: delta report, ``None`` if not enabled or cannot be opened
+    :rtype: DeltaReport or None
+    :raise Exception: ``exc`` delta state file creation issue, full reports will be exported
+    """
+    settings = {**DEFAULT_DELTA, **(_config.get('delta') or {})}
+    if not settings['enabled']:
+        return None
+    try:
+        delta = DeltaReport(str(Path(__file__).parent / settings['path']), writer)
+    except Exception as exc:
+        log.warning(f"cannot open delta state [{settings['path']}]: {str(exc)}, full reports will be exported")
+        return None
+    log.info("delta mode: only port changes since a previous run will be exported")
+    return delta
+
+
+def get_report_writer(log: logging.Logger, _config: dict[str, Any]) -> ReportWriter:
+    """
+    Create report writer saving files in an exports subdirectory of a script directory, in a configured format
+    and compression. Fall back to a csv format if value is incorrect or optional ``pyarrow`` library is not
+    installed, and to uncompressed files if compression is incorrect or its optional library is not installed.
+    Exit script execution in case of an exception.
+
+    :param log: log object
+    :param _config: configuration file content dict
+    :type log: logging.Logger
+    :type: _config: dict[str, Any]
+    :return: report writer
+    :rtype: ReportWriter
+    :raise Exception: ``exc`` exports directory creation exception, exiting script as a result
+    """
+    settings = {**DEFAULT_EXPORT, **(_config.get('export') or {})}
+    export_format = settings['format']
+    if export_format not in ('csv', 'parquet'):
+        log.warning(f"incorrect [export] format: {export_format}, csv format will be used")
+        export_format = 'csv'
+    if export_format == 'parquet' and pa is None:
+        log.warning(f"parquet export requested but library is not installed (pip install pyarrow),"
+                    f" csv format will be used")
+        export_format = 'csv'
+    compression = settings['compression'] or ''
+    if compression not in CSV_EXTENSIONS:
+        log.warning(f"incorrect [export] compression: {compression}, files will not be compressed")
+        compression = ''
+    # parquet files are compressed by pyarrow itself
+    if compression == 'zstd' and export_format == 'csv' and zstandard is None:
+        log.warning(f"zstd compression requested but library is not installed (pip install zstandard),"
+                    f" files will not be compressed")
+        compression = ''
+    if settings['append'] and export_format == 'parquet':
+        log.warning(f"append mode is not supported by parquet format, a new file will be created per subject")
+    try:
+        export_directory = Path(__file__).parent / 'exports'
+        export_directory.mkdir(exist_ok=True)
+        if export_format == 'parquet':
+            return ParquetReportWriter(log, export_directory, compression)
+        return ReportWriter(log, export_directory, compression, bool(settings['append']))
+    except Exception as exc:
+        log.critical(f"cannot prepare data export: {str(exc)}, script will now exit")
+        exit()
+
+
+def export_data(log: logging.Logger, writer: ReportWriter) -> None:
+    """
+    Finish data export: close report files written during a run, saved in an exports directory.
 
     :param log: log object
-    :param data: devices data dict
+    :param writer: report writer
     :type log: logging.Logger
-    :type data: dict[str, Any]
+    :type writer: ReportWriter
     :raise Exception: ``exc`` data export exception - please check if file can be exported to a designated
             directory and, optionally, validate exported content
     """
     log.info("-------------------")
-    if data:
-        log.info(f"attempting data export: {len(data)} data set(s)")
-        try:
-            # set file save parameters
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            export_directory = Path(__file__).parent / 'exports'
-            export_directory.mkdir(exist_ok=True)
-            # export files per subject
-            for subject in data:
-                export_name = f"{timestamp}_{subject}_export.csv"
-                export_path = export_directory / export_name
-                # perform export
-                with open(export_path, "w", newline="", encoding="utf-8") as file:
-                    writer = csv.writer(file)
-                    writer.writerows(data[subject])
-                log.info(f"> file saved: {export_path}")
-        # exit script on any potential exception
-        except Exception as exc:
-            log.warning(f"cannot perform data export: {str(exc)}, script will now exit")
-        exit()
+    try:
+        saved = writer.close()
+    except Exception as exc:
+        log.warning(f"cannot finish data export: {str(exc)}")
+        return
+    if saved:
+        log.info(f"data export finished: {len(saved)} data set(s)")
+        for export_path in saved:
+            log.info(f"> file saved: {export_path}")
     else:
         log.info("no data to export")
     log.info("all actions finished")
-    return
 
 
 if __name__ == '__main__':